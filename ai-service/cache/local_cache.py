@@ -0,0 +1,79 @@
+"""In-process TTL/LRU cache used in front of the shared Redis cache."""
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+
+class LocalTTLCache:
+    """
+    Bounded per-process cache with a fixed time-to-live.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is
+    reached, and dropped lazily when read after they expire. ``get``
+    returns a copy, so a caller mutating its result cannot change what
+    other requests read.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 300.0,
+        copier: Optional[Callable[[Any], Any]] = copy.deepcopy
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Upper bound on entry lifetime in seconds
+            copier: Applied to values on ``get``; a cheaper copy suits flat
+                values, None only for immutable ones
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._copier = copier
+        # key -> (expires_at (monotonic), value)
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached value, or None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1] if self._copier is None else self._copier(entry[1])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store; the cache takes ownership, so do not
+                mutate it afterwards
+            ttl: Lifetime in seconds, capped at the cache-wide TTL
+        """
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + lifetime, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,7 +2,7 @@
 import json
 import logging
 import time
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,18 @@ class MockCache:
             logger.error(f"Mock cache get error for key {key}: {str(e)}")
             return None
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get multiple values from mock cache.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached values in key order, None for missing or expired keys
+        """
+        return [await self.get(key) for key in keys]
+    
     async def set(self, key: str, value: Any, ttl: Optional[int] = None, expire: Optional[int] = None) -> bool:
         """
         Set value in mock cache.
@@ -1,12 +1,21 @@
 """Redis cache implementation for AI model responses."""
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, List, Optional
 import redis.asyncio as redis
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# INCRBY that only sets the TTL when it creates the key, atomically in one round trip
+INCREMENT_SCRIPT = """
+local count = redis.call('INCRBY', KEYS[1], ARGV[1])
+if count == tonumber(ARGV[1]) and tonumber(ARGV[2]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return count
+"""
+
 
 class RedisCache:
     """Redis cache for AI model responses and rate limiting."""
@@ -14,20 +23,29 @@ class RedisCache:
     def __init__(self):
         """Initialize Redis connection."""
         self.redis_client: Optional[redis.Redis] = None
+        self.connection_pool: Optional[redis.BlockingConnectionPool] = None
+        self.increment_script = None
         self.ttl = settings.cache_ttl_seconds
     
     async def connect(self):
-        """Establish Redis connection."""
+        """Establish a pooled Redis connection shared by all requests."""
         try:
-            self.redis_client = redis.Redis(
+            # Blocking pool: callers wait for a free connection instead of
+            # opening unbounded new ones under load
+            self.connection_pool = redis.BlockingConnectionPool(
                 host=settings.redis_host,
                 port=settings.redis_port,
                 password=settings.redis_password,
                 db=settings.redis_db,
+                max_connections=settings.redis_max_connections,
                 decode_responses=True
             )
+            self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+            self.increment_script = self.redis_client.register_script(INCREMENT_SCRIPT)
             # Test connection
             await self.redis_client.ping()
+            # Preload so the first rate-limit check is a plain EVALSHA hit
+            await self.redis_client.script_load(INCREMENT_SCRIPT)
             logger.info("Redis connection established")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {str(e)}")
@@ -38,6 +56,8 @@ class RedisCache:
         if self.redis_client:
             await self.redis_client.close()
             logger.info("Redis connection closed")
+        if self.connection_pool:
+            await self.connection_pool.disconnect()
     
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -61,7 +81,27 @@ class RedisCache:
             logger.error(f"Cache get error for key {key}: {str(e)}")
             return None
     
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get multiple values from cache in a single round trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached values in key order, None for missing keys
+        """
+        if not self.redis_client or not keys:
+            return [None] * len(keys)
+        
+        try:
+            values = await self.redis_client.mget(keys)
+            return [json.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache mget error for {len(keys)} keys: {str(e)}")
+            return [None] * len(keys)
+    
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, expire: Optional[int] = None) -> bool:
         """
         Set value in cache.
         
@@ -69,6 +109,7 @@ class RedisCache:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds (optional)
+            expire: Alternative name for ttl (for compatibility)
             
         Returns:
             True if successful, False otherwise
@@ -80,7 +121,7 @@ class RedisCache:
             serialized_value = json.dumps(value, default=str)
             await self.redis_client.setex(
                 key, 
-                ttl or self.ttl, 
+                expire or ttl or self.ttl, 
                 serialized_value
             )
             return True
@@ -124,13 +165,9 @@ class RedisCache:
             return None
         
         try:
-            # Use pipeline for atomic operations
-            pipe = self.redis_client.pipeline()
-            pipe.incr(key, amount)
-            if ttl:
-                pipe.expire(key, ttl)
-            results = await pipe.execute()
-            return results[0]
+            # Server-side script: one round trip, and the window TTL is not
+            # pushed back by every later increment
+            return await self.increment_script(keys=[key], args=[amount, ttl or 0])
         except Exception as e:
             logger.error(f"Cache increment error for key {key}: {str(e)}")
             return None
@@ -18,6 +18,7 @@ class Settings(BaseSettings):
     redis_port: int = int(os.getenv("REDIS_PORT", "6379"))
     redis_password: Optional[str] = os.getenv("REDIS_PASSWORD")
     redis_db: int = int(os.getenv("REDIS_DB", "0"))
+    redis_max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
     
     # Cache Configuration
     cache_ttl_seconds: int = int(os.getenv("CACHE_TTL_SECONDS", "3600"))  # 1 hour
@@ -25,11 +26,18 @@ class Settings(BaseSettings):
     # Rate Limiting Configuration
     rate_limit_requests: int = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))
     rate_limit_window: int = int(os.getenv("RATE_LIMIT_WINDOW", "3600"))  # 1 hour
+    rate_limit_sync_every: int = int(os.getenv("RATE_LIMIT_SYNC_EVERY", "10"))  # local hits per Redis sync
+    rate_limit_local_keys: int = int(os.getenv("RATE_LIMIT_LOCAL_KEYS", "4096"))
     
     # API Configuration
     api_host: str = os.getenv("API_HOST", "0.0.0.0")
     api_port: int = int(os.getenv("API_PORT", "8001"))
     debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+    api_workers: int = int(os.getenv("API_WORKERS", "0"))  # 0 = half the CPU cores
+    # Build internally produced response models without re-validation (off in debug)
+    trusted_construct: bool = os.getenv(
+        "TRUSTED_CONSTRUCT", "false" if os.getenv("DEBUG", "false").lower() == "true" else "true"
+    ).lower() == "true"
     
     class Config:
         env_file = ".env"
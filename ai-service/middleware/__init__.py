@@ -1,4 +1,4 @@
 """Middleware modules."""
-from .rate_limiter import rate_limit_middleware
+from .rate_limiter import RateLimiter, RateLimitMiddleware
 
-__all__ = ["rate_limit_middleware"]
\ No newline at end of file
+__all__ = ["RateLimiter", "RateLimitMiddleware"]
\ No newline at end of file
@@ -1,14 +1,26 @@
 """Rate limiting middleware for AI service endpoints."""
 import time
+import hashlib
 import logging
-from typing import Callable
-from fastapi import Request, HTTPException, status
+from collections import OrderedDict
+from typing import Optional
+from fastapi import status
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
 from cache.redis_cache import redis_cache
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Health checks, the root endpoint and API docs are never rate limited
+_SKIP_PATHS = frozenset({"/", "/health", "/docs", "/redoc", "/openapi.json"})
+_WINDOW_TEXT = str(settings.rate_limit_window)
+
 
 class RateLimiter:
     """Rate limiter using Redis for distributed rate limiting."""
@@ -16,7 +28,10 @@ class RateLimiter:
     def __init__(
         self,
         requests_per_window: int = settings.rate_limit_requests,
-        window_seconds: int = settings.rate_limit_window
+        window_seconds: int = settings.rate_limit_window,
+        sync_every: int = settings.rate_limit_sync_every,
+        max_local_keys: int = settings.rate_limit_local_keys,
+        cache=None
     ):
         """
         Initialize rate limiter.
@@ -24,27 +39,87 @@ class RateLimiter:
         Args:
             requests_per_window: Maximum requests allowed per window
             window_seconds: Time window in seconds
+            sync_every: Requests answered from the local bucket between Redis syncs
+            max_local_keys: Identifiers kept in the local bucket LRU
+            cache: Shared cache client holding the counters (defaults to redis_cache)
         """
+        self.cache = cache or redis_cache
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
+        self.sync_every = sync_every
+        self.max_local_keys = max_local_keys
+        # identifier -> [window start, remaining per Redis minus local hits, hits not yet sent to Redis]
+        self._local_buckets: OrderedDict[str, list] = OrderedDict()
     
-    async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
+    def _take_local_token(self, identifier: str, window_start: int) -> Optional[int]:
+        """
+        Try to admit a request from the quota Redis last reported for this window.
+        
+        The bucket never refills over time: it only holds what is left of the
+        current fixed window, and is dropped (with any unsynced hits) once the
+        window rolls over.
+        
+        Args:
+            identifier: Unique identifier for rate limiting
+            window_start: Start of the current fixed window
+            
+        Returns:
+            Remaining requests if admitted locally, None if Redis must be consulted
+        """
+        bucket = self._local_buckets.get(identifier)
+        if bucket is None:
+            return None
+        if bucket[0] != window_start:
+            # Hits admitted in an earlier window must not count against this one
+            del self._local_buckets[identifier]
+            return None
+        self._local_buckets.move_to_end(identifier)
+        
+        # Keep one request in reserve and sync periodically so other workers' hits are seen
+        if bucket[1] < 2 or bucket[2] + 1 >= self.sync_every:
+            return None
+        
+        bucket[1] -= 1
+        bucket[2] += 1
+        return bucket[1]
+    
+    def _store_local_bucket(self, identifier: str, window_start: int, remaining: int) -> None:
+        """Reset the local bucket from the distributed count in Redis."""
+        self._local_buckets[identifier] = [window_start, remaining, 0]
+        self._local_buckets.move_to_end(identifier)
+        if len(self._local_buckets) > self.max_local_keys:
+            self._local_buckets.popitem(last=False)
+    
+    async def is_allowed(self, identifier: str, now: Optional[int] = None) -> tuple[bool, dict]:
         """
         Check if request is allowed based on rate limits.
         
         Args:
             identifier: Unique identifier for rate limiting (e.g., IP, user ID)
+            now: Current Unix time in seconds, taken by the caller if already known
             
         Returns:
             Tuple of (is_allowed, rate_limit_info)
         """
-        current_time = int(time.time())
+        current_time = int(time.time()) if now is None else now
         window_start = current_time - (current_time % self.window_seconds)
         key = f"rate_limit:{identifier}:{window_start}"
         
+        # Common case: plenty of quota left, answered without a Redis round trip
+        remaining = self._take_local_token(identifier, window_start)
+        if remaining is not None:
+            return True, {
+                "requests_remaining": remaining,
+                "reset_time": window_start + self.window_seconds,
+                "limit": self.requests_per_window
+            }
+        
+        bucket = self._local_buckets.get(identifier)
+        amount = 1 + (bucket[2] if bucket else 0)
+        
         try:
-            # Get current count for this window
-            current_count = await redis_cache.increment(key, 1, self.window_seconds)
+            # Get current count for this window, including locally admitted hits
+            current_count = await self.cache.increment(key, amount, self.window_seconds)
             
             if current_count is None:
                 # Redis unavailable, allow request but log warning
@@ -56,6 +131,7 @@ class RateLimiter:
                 }
             
             is_allowed = current_count <= self.requests_per_window
+            self._store_local_bucket(identifier, window_start, max(0, self.requests_per_window - current_count))
             
             rate_limit_info = {
                 "requests_remaining": max(0, self.requests_per_window - current_count),
@@ -75,73 +151,110 @@ class RateLimiter:
                 "limit": self.requests_per_window
             }
     
-    def get_identifier(self, request: Request) -> str:
+    def get_identifier(self, scope: Scope) -> str:
         """
         Get unique identifier for rate limiting.
         
         Args:
-            request: FastAPI request object
+            scope: ASGI connection scope
             
         Returns:
             Unique identifier string
         """
-        # Try to get user ID from auth header, fallback to IP
-        auth_header = request.headers.get("authorization")
-        if auth_header:
-            # Extract user ID from JWT token if available
-            # For now, use the auth header as identifier
-            return f"user:{auth_header[:20]}"  # Truncate for privacy
+        state = scope.setdefault("state", {})
+        identifier = state.get("rl_id")
+        if identifier is not None:
+            return identifier
         
-        # Fallback to client IP
-        client_ip = request.client.host if request.client else "unknown"
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
+        # Single pass over the raw (lowercased bytes) header pairs
+        auth_header = forwarded_for = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+            elif name == b"x-forwarded-for":
+                forwarded_for = value
         
-        return f"ip:{client_ip}"
+        if auth_header:
+            # Fixed-size digest instead of the raw token: keeps it private
+            # and tokens sharing a prefix no longer collapse to one bucket
+            identifier = f"user:{hashlib.blake2b(auth_header, digest_size=8).hexdigest()}"
+        elif forwarded_for:
+            identifier = f"ip:{forwarded_for.split(b',', 1)[0].strip().decode('latin-1')}"
+        else:
+            # Fallback to client IP
+            client = scope.get("client")
+            identifier = f"ip:{client[0] if client else 'unknown'}"
+        
+        state["rl_id"] = identifier
+        return identifier
 
 
-async def rate_limit_middleware(request: Request, call_next: Callable):
+class RateLimitMiddleware:
     """
-    Rate limiting middleware for FastAPI.
+    Pure ASGI rate limiting middleware.
     
-    Args:
-        request: FastAPI request object
-        call_next: Next middleware/endpoint in chain
-        
-    Returns:
-        Response or rate limit error
+    Works on the raw connection scope, avoiding the Request construction and
+    response wrapping done by function-based HTTP middleware.
     """
-    # Skip rate limiting for health checks and root endpoint
-    if request.url.path in ["/", "/health", "/docs", "/redoc", "/openapi.json"]:
-        return await call_next(request)
-    
-    rate_limiter = RateLimiter()
-    identifier = rate_limiter.get_identifier(request)
-    
-    is_allowed, rate_info = await rate_limiter.is_allowed(identifier)
     
-    if not is_allowed:
-        logger.warning(f"Rate limit exceeded for {identifier}")
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "error": "Rate limit exceeded",
-                "message": f"Too many requests. Limit: {rate_info['limit']} per {settings.rate_limit_window} seconds",
-                "retry_after": rate_info["reset_time"] - int(time.time())
-            },
-            headers={
-                "X-RateLimit-Limit": str(rate_info["limit"]),
-                "X-RateLimit-Remaining": str(rate_info["requests_remaining"]),
-                "X-RateLimit-Reset": str(rate_info["reset_time"]),
-                "Retry-After": str(rate_info["reset_time"] - int(time.time()))
-            }
-        )
-    
-    # Add rate limit headers to successful responses
-    response = await call_next(request)
-    response.headers["X-RateLimit-Limit"] = str(rate_info["limit"])
-    response.headers["X-RateLimit-Remaining"] = str(rate_info["requests_remaining"])
-    response.headers["X-RateLimit-Reset"] = str(rate_info["reset_time"])
+    def __init__(self, app: ASGIApp, cache=None):
+        """
+        Initialize middleware.
+        
+        Args:
+            app: Wrapped ASGI application
+            cache: Shared cache client, connected once at application startup
+        """
+        self.app = app
+        self.rate_limiter = RateLimiter(cache=cache)
     
-    return response
\ No newline at end of file
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Skip rate limiting for health checks and root endpoint
+        if scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        now = int(time.time())
+        identifier = self.rate_limiter.get_identifier(scope)
+        is_allowed, rate_info = await self.rate_limiter.is_allowed(identifier, now=now)
+        limit_text = str(rate_info["limit"])
+        remaining_text = str(rate_info["requests_remaining"])
+        reset_text = str(rate_info["reset_time"])
+        
+        if not is_allowed:
+            logger.warning(f"Rate limit exceeded for {identifier}")
+            retry_after = rate_info["reset_time"] - now
+            response = DefaultResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "error": "Rate limit exceeded",
+                    "message": f"Too many requests. Limit: {limit_text} per {_WINDOW_TEXT} seconds",
+                    "retry_after": retry_after
+                },
+                headers={
+                    "X-RateLimit-Limit": limit_text,
+                    "X-RateLimit-Remaining": remaining_text,
+                    "X-RateLimit-Reset": reset_text,
+                    "Retry-After": str(retry_after)
+                }
+            )
+            await response(scope, receive, send)
+            return
+        
+        # Add rate limit headers to successful responses
+        rate_limit_headers = [
+            (b"x-ratelimit-limit", limit_text.encode()),
+            (b"x-ratelimit-remaining", remaining_text.encode()),
+            (b"x-ratelimit-reset", reset_text.encode()),
+        ]
+        
+        async def send_with_rate_limit_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *rate_limit_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_rate_limit_headers)
@@ -21,6 +21,7 @@ from .resolution_models import (
     EmbeddingRequest,
     EmbeddingResponse
 )
+from .workload_models import WorkloadOptimizationRequest
 
 __all__ = [
     "TicketCategory",
@@ -40,5 +41,6 @@ __all__ = [
     "SimilarityMatch",
     "ResolutionSuggestionResponse",
     "EmbeddingRequest",
-    "EmbeddingResponse"
+    "EmbeddingResponse",
+    "WorkloadOptimizationRequest"
 ]
\ No newline at end of file
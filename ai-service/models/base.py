@@ -0,0 +1,78 @@
+"""Shared helpers for pydantic models."""
+import hashlib
+from typing import Any, ClassVar, Dict, FrozenSet
+
+from config import settings
+
+
+class TrustedConstructMixin:
+    """Skip validation for models built from data our own services produced."""
+
+    # Field name -> nested model class; dict (or list of dict) values are built recursively
+    trusted_nested: ClassVar[Dict[str, type]] = {}
+
+    @classmethod
+    def build_trusted(cls, **kwargs: Any):
+        """
+        Build an instance without validation when TRUSTED_CONSTRUCT is enabled.
+
+        Only use with internally produced values; with the setting off (the
+        default in debug mode) this is a normal validating constructor.
+        """
+        if not settings.trusted_construct:
+            return cls(**kwargs)
+
+        for name, model in cls.trusted_nested.items():
+            value = kwargs.get(name)
+            if isinstance(value, dict):
+                kwargs[name] = _build_nested(model, value)
+            elif isinstance(value, list):
+                kwargs[name] = [
+                    _build_nested(model, item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+        return cls.model_construct(_fields_set=set(kwargs), **kwargs)
+
+
+def _build_nested(model: type, data: Dict[str, Any]):
+    """Construct a nested model, recursing through its own nested fields."""
+    if issubclass(model, TrustedConstructMixin):
+        return model.build_trusted(**data)
+    return model.model_construct(**data)
+
+
+class CacheKeyMixin:
+    """Stable digest of the request content that determines the answer."""
+
+    # Fields that identify a request but do not change the prediction
+    cache_key_exclude: ClassVar[FrozenSet[str]] = frozenset({"ticket_id"})
+
+    def cache_key(self) -> str:
+        """
+        Hash the request payload, minus ``cache_key_exclude``.
+
+        Identical tickets submitted under different IDs share a key, so
+        prediction caches hit on content rather than on ticket identity.
+        """
+        payload = self.model_dump_json(exclude=set(self.cache_key_exclude))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def text_digest(text: str) -> bytes:
+    """16-byte blake2b digest used to key per-text caches (e.g. embeddings)."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class TextHashMixin:
+    """
+    Hash of the ticket text, computed once per request and shared by services.
+
+    Models using this declare ``_text_hash: Optional[bytes] = PrivateAttr(None)``.
+    """
+
+    @property
+    def text_hash(self) -> bytes:
+        """Digest of ``f"{title} {description}"``, the text embedded for similarity search."""
+        if self._text_hash is None:
+            self._text_hash = text_digest(f"{self.title} {self.description}")
+        return self._text_hash
@@ -1,11 +1,16 @@
 """Pydantic models for resolution suggestion system."""
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import ClassVar, List, Optional, Dict, Any
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_serializer, field_validator
+
+from .base import CacheKeyMixin, TextHashMixin, TrustedConstructMixin
 
 
 class HistoricalTicket(BaseModel):
     """Model for historical ticket data."""
+    model_config = ConfigDict(frozen=True)
+    
     ticket_id: str
     title: str
     description: str
@@ -20,7 +25,7 @@ class HistoricalTicket(BaseModel):
     resolved_at: Optional[datetime] = None
 
 
-class ResolutionSuggestionRequest(BaseModel):
+class ResolutionSuggestionRequest(CacheKeyMixin, TextHashMixin, BaseModel):
     """Request model for resolution suggestions."""
     ticket_id: str = Field(..., description="Current ticket identifier")
     title: str = Field(..., description="Ticket title/subject")
@@ -31,10 +36,14 @@ class ResolutionSuggestionRequest(BaseModel):
     customer_environment: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Customer environment details")
     max_suggestions: int = Field(default=5, ge=1, le=10, description="Maximum number of suggestions to return")
     include_knowledge_base: bool = Field(default=True, description="Include knowledge base articles")
+    
+    _text_hash: Optional[bytes] = PrivateAttr(None)
 
 
-class ResolutionStep(BaseModel):
+class ResolutionStep(TrustedConstructMixin, BaseModel):
     """Individual resolution step."""
+    model_config = ConfigDict(frozen=True)
+    
     step_number: int
     description: str
     command: Optional[str] = Field(None, description="Command to execute if applicable")
@@ -42,8 +51,12 @@ class ResolutionStep(BaseModel):
     troubleshooting_tips: Optional[List[str]] = Field(default_factory=list)
 
 
-class ResolutionSuggestion(BaseModel):
+class ResolutionSuggestion(TrustedConstructMixin, BaseModel):
     """Individual resolution suggestion."""
+    trusted_nested: ClassVar[Dict[str, type]] = {"resolution_steps": ResolutionStep}
+    # Child model instances are kept by reference, not copied or revalidated
+    model_config = ConfigDict(revalidate_instances='never')
+    
     suggestion_id: str
     title: str
     description: str
@@ -60,6 +73,8 @@ class ResolutionSuggestion(BaseModel):
 
 class KnowledgeBaseArticle(BaseModel):
     """Knowledge base article model."""
+    model_config = ConfigDict(frozen=True)
+    
     article_id: str
     title: str
     content: str
@@ -70,8 +85,10 @@ class KnowledgeBaseArticle(BaseModel):
     helpfulness_score: Optional[float] = Field(None, ge=0.0, le=5.0)
 
 
-class SimilarityMatch(BaseModel):
+class SimilarityMatch(TrustedConstructMixin, BaseModel):
     """Similarity match result."""
+    model_config = ConfigDict(frozen=True)
+    
     ticket_id: str
     similarity_score: float = Field(..., ge=0.0, le=1.0)
     title: str
@@ -79,8 +96,15 @@ class SimilarityMatch(BaseModel):
     resolution_summary: str
 
 
-class ResolutionSuggestionResponse(BaseModel):
+class ResolutionSuggestionResponse(TrustedConstructMixin, BaseModel):
     """Response model for resolution suggestions."""
+    trusted_nested: ClassVar[Dict[str, type]] = {
+        "suggestions": ResolutionSuggestion,
+        "similar_tickets": SimilarityMatch
+    }
+    # Child model instances are kept by reference, not copied or revalidated
+    model_config = ConfigDict(revalidate_instances='never')
+    
     success: bool
     ticket_id: str
     suggestions: List[ResolutionSuggestion] = Field(default_factory=list)
@@ -97,7 +121,31 @@ class EmbeddingRequest(BaseModel):
 
 
 class EmbeddingResponse(BaseModel):
-    """Response for text embedding."""
-    embedding: List[float]
+    """
+    Response for text embedding.
+    
+    Accepts and serializes ``embedding`` as a JSON list of floats but holds
+    it as a float32 ndarray internally.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    embedding: np.ndarray
     model: str
-    usage_tokens: int
\ No newline at end of file
+    usage_tokens: int
+    
+    @field_validator('embedding', mode='before')
+    @classmethod
+    def to_array(cls, v):
+        """Store the vector as contiguous float32."""
+        return np.ascontiguousarray(v, dtype=np.float32)
+    
+    @field_serializer('embedding', when_used='json')
+    def embedding_to_list(self, value: np.ndarray) -> List[float]:
+        """Emit a plain list for external clients."""
+        return value.tolist()
+
+
+# Compiled validators for hot paths: validate_python(dict) / validate_json(bytes)
+VALIDATORS = {
+    "HistoricalTickets": TypeAdapter(List[HistoricalTicket]),
+}
@@ -2,11 +2,16 @@
 SLA prediction models and data structures.
 """
 
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import ClassVar, FrozenSet, List, Optional, Dict, Any
+import attrs
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_serializer
 from enum import Enum
 
+from .base import CacheKeyMixin, TextHashMixin, TrustedConstructMixin
+
 
 class TicketStatus(str, Enum):
     """Ticket status enumeration."""
@@ -32,9 +37,38 @@ class CustomerTier(str, Enum):
     ENTERPRISE = "enterprise"
 
 
-class SLAPredictionRequest(BaseModel):
+# Integer codes in definition order, for numeric tables and feature arrays.
+# The wire format stays the string value.
+STATUS_CODES = {member: code for code, member in enumerate(TicketStatus)}
+PRIORITY_CODES = {member: code for code, member in enumerate(Priority)}
+TIER_CODES = {member: code for code, member in enumerate(CustomerTier)}
+_BY_CODE = {
+    "status": tuple(TicketStatus),
+    "priority": tuple(Priority),
+    "customer_tier": tuple(CustomerTier),
+}
+# Value string -> member, for direct lookups instead of Enum.__call__
+_BY_VALUE = {field: {member.value: member for member in members} for field, members in _BY_CODE.items()}
+
+# Fixed scoring tables indexed by the codes above
+PRIORITY_SCORE = (1, 2, 3, 4)
+TIER_SCORE = (1, 2, 3)
+PRIORITY_RISK_MULTIPLIER = (0.8, 1.0, 1.2, 1.4)
+STATUS_RISK_MULTIPLIER = (1.3, 1.0, 0.7, 0.0, 0.0)
+PRIORITY_BASE_MINUTES = (1440, 480, 240, 60)
+
+# Business hours (Monday-Friday, 9 AM - 5 PM UTC) indexed [weekday, hour]
+BUSINESS_HOURS_MASK = np.zeros((7, 24), dtype=bool)
+BUSINESS_HOURS_MASK[:5, 9:17] = True
+BUSINESS_HOURS_MASK.setflags(write=False)
+
+
+class SLAPredictionRequest(CacheKeyMixin, TextHashMixin, BaseModel):
     """Request model for SLA breach prediction."""
     
+    # The prediction time is keyed separately (see prediction_timestamp)
+    cache_key_exclude: ClassVar[FrozenSet[str]] = frozenset({"ticket_id", "current_time"})
+    
     ticket_id: str = Field(..., description="Unique ticket identifier")
     customer_id: str = Field(..., description="Customer identifier")
     customer_tier: CustomerTier = Field(..., description="Customer service tier")
@@ -67,9 +101,38 @@ class SLAPredictionRequest(BaseModel):
     day_of_week: Optional[int] = Field(None, ge=0, le=6, description="Day of week (0=Sunday)")
     hour_of_day: Optional[int] = Field(None, ge=0, le=23, description="Hour of day (0-23)")
     
-    @validator('current_time', pre=True, always=True)
-    def set_current_time(cls, v):
-        return v or datetime.utcnow()
+    @field_validator('customer_tier', 'priority', 'status', mode='before')
+    @classmethod
+    def accept_codes(cls, v, info):
+        """Accept integer codes as well as the string values."""
+        if isinstance(v, str):
+            return _BY_VALUE[info.field_name].get(v, v)
+        if isinstance(v, int) and not isinstance(v, bool):
+            members = _BY_CODE[info.field_name]
+            if 0 <= v < len(members):
+                return members[v]
+        return v
+    
+    # Arrival time as epoch ns; a datetime is only built if something asks for it
+    _received_ns: int = PrivateAttr(default_factory=time.time_ns)
+    _prediction_time: Optional[datetime] = PrivateAttr(None)
+    _text_hash: Optional[bytes] = PrivateAttr(None)
+    
+    @property
+    def prediction_time(self) -> datetime:
+        """current_time if supplied, else the (naive UTC) time the request arrived."""
+        if self.current_time is not None:
+            return self.current_time
+        if self._prediction_time is None:
+            self._prediction_time = datetime.utcfromtimestamp(self._received_ns / 1e9)
+        return self._prediction_time
+    
+    @property
+    def prediction_timestamp(self) -> int:
+        """Prediction time in whole epoch seconds, without building a datetime."""
+        if self.current_time is not None:
+            return int(self.current_time.timestamp())
+        return self._received_ns // 1_000_000_000
 
 
 class SLARiskLevel(str, Enum):
@@ -80,9 +143,33 @@ class SLARiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
-class SLAPredictionResult(BaseModel):
+RISK_LEVEL_CODES = {member: code for code, member in enumerate(SLARiskLevel)}
+RISK_LEVEL_BY_VALUE = {member.value: member for member in SLARiskLevel}
+
+
+class RiskFactorScores(BaseModel):
+    """Scores for the risk factors that apply; factors that do not apply are left out."""
+    
+    time_remaining: Optional[float] = None
+    slow_progress: Optional[float] = None
+    unassigned: Optional[float] = None
+    high_workload: Optional[float] = None
+    complexity: Optional[float] = None
+    priority: Optional[float] = None
+    escalation: Optional[float] = None
+    business_hours: Optional[float] = None
+    
+    @model_serializer(mode='wrap')
+    def omit_absent(self, handler):
+        """Serialize as the sparse mapping clients already receive."""
+        return {name: score for name, score in handler(self).items() if score is not None}
+
+
+class SLAPredictionResult(TrustedConstructMixin, BaseModel):
     """SLA prediction result."""
     
+    trusted_nested: ClassVar[Dict[str, type]] = {"risk_factor_scores": RiskFactorScores}
+    
     ticket_id: str = Field(..., description="Ticket identifier")
     breach_probability: float = Field(..., ge=0.0, le=1.0, description="Probability of SLA breach (0-1)")
     risk_level: SLARiskLevel = Field(..., description="Risk level classification")
@@ -95,17 +182,29 @@ class SLAPredictionResult(BaseModel):
     
     # Risk factors
     primary_risk_factors: List[str] = Field(default_factory=list, description="Main factors contributing to risk")
-    risk_factor_scores: Dict[str, float] = Field(default_factory=dict, description="Individual risk factor scores")
+    risk_factor_scores: RiskFactorScores = Field(default_factory=RiskFactorScores, description="Individual risk factor scores")
     
     # Recommendations
     recommended_actions: List[str] = Field(default_factory=list, description="Recommended actions to mitigate risk")
     escalation_recommended: bool = Field(False, description="Whether escalation is recommended")
     reassignment_recommended: bool = Field(False, description="Whether reassignment is recommended")
+    
+    @field_validator('risk_level', mode='before')
+    @classmethod
+    def lookup_risk_level(cls, v):
+        """Resolve string values (e.g. from cached results) with a dict lookup."""
+        if isinstance(v, str):
+            return RISK_LEVEL_BY_VALUE.get(v, v)
+        return v
 
 
-class SLAPredictionResponse(BaseModel):
+class SLAPredictionResponse(TrustedConstructMixin, BaseModel):
     """Response model for SLA prediction."""
     
+    trusted_nested: ClassVar[Dict[str, type]] = {"result": SLAPredictionResult}
+    # Child model instances are kept by reference, not copied or revalidated
+    model_config = ConfigDict(revalidate_instances='never')
+    
     success: bool = Field(..., description="Whether the prediction was successful")
     result: Optional[SLAPredictionResult] = Field(None, description="Prediction result")
     error: Optional[str] = Field(None, description="Error message if prediction failed")
@@ -117,6 +216,8 @@ class SLAPredictionResponse(BaseModel):
 class HistoricalTicketData(BaseModel):
     """Historical ticket data for training and context."""
     
+    model_config = ConfigDict(frozen=True)
+    
     ticket_id: str
     customer_tier: CustomerTier
     priority: Priority
@@ -146,8 +247,14 @@ class HistoricalTicketData(BaseModel):
     was_reassigned: bool
 
 
-class SLAModelFeatures(BaseModel):
-    """Feature vector for SLA prediction model."""
+@attrs.frozen
+class SLAModelFeatures:
+    """
+    Feature vector for SLA prediction model.
+    
+    Internal only (built by the prediction service), so it is a slotted
+    attrs class with no runtime validation.
+    """
     
     # Time-based features
     time_remaining_ratio: float  # (deadline - current) / (deadline - created)
@@ -184,10 +291,11 @@ class SLAModelFeatures(BaseModel):
     response_velocity: float  # responses per hour
 
 
-class SLATrainingData(BaseModel):
+@attrs.frozen
+class SLATrainingData:
     """Training data structure for SLA prediction model."""
     
     features: SLAModelFeatures
     target: float  # breach probability (0-1)
     actual_outcome: bool  # whether SLA was actually breached
-    ticket_metadata: Dict[str, Any]  # additional context
\ No newline at end of file
+    ticket_metadata: Dict[str, Any]  # additional context
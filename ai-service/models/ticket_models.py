@@ -1,8 +1,10 @@
 """Pydantic models for ticket triage and AI processing."""
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import ClassVar, FrozenSet, List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator
+
+from .base import CacheKeyMixin, TextHashMixin, TrustedConstructMixin
 
 
 class TicketCategory(str, Enum):
@@ -42,8 +44,30 @@ class Impact(str, Enum):
     LOW = "low"
 
 
-class TicketTriageRequest(BaseModel):
+# Integer codes in definition order, for numeric tables and model outputs.
+# The wire format stays the string value.
+CATEGORY_CODES = {member: code for code, member in enumerate(TicketCategory)}
+PRIORITY_CODES = {member: code for code, member in enumerate(Priority)}
+URGENCY_CODES = {member: code for code, member in enumerate(Urgency)}
+IMPACT_CODES = {member: code for code, member in enumerate(Impact)}
+_BY_CODE = {
+    "category": tuple(TicketCategory),
+    "priority": tuple(Priority),
+    "urgency": tuple(Urgency),
+    "impact": tuple(Impact),
+}
+# Value string -> member, for direct lookups instead of Enum.__call__
+_BY_VALUE = {field: {member.value: member for member in members} for field, members in _BY_CODE.items()}
+CATEGORY_BY_VALUE = _BY_VALUE["category"]
+PRIORITY_BY_VALUE = _BY_VALUE["priority"]
+URGENCY_BY_VALUE = _BY_VALUE["urgency"]
+IMPACT_BY_VALUE = _BY_VALUE["impact"]
+
+
+class TicketTriageRequest(CacheKeyMixin, TextHashMixin, BaseModel):
     """Request model for ticket triage."""
+    cache_key_exclude: ClassVar[FrozenSet[str]] = frozenset({"ticket_id", "customer_id", "reported_by", "attachments"})
+    
     ticket_id: str = Field(..., description="Unique ticket identifier")
     title: str = Field(..., description="Ticket title/subject")
     description: str = Field(..., description="Detailed ticket description")
@@ -55,14 +79,13 @@ class TicketTriageRequest(BaseModel):
     attachments: Optional[List[str]] = Field(default_factory=list, description="List of attachment filenames")
     created_at: Optional[datetime] = Field(None, description="Ticket creation timestamp")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    _text_hash: Optional[bytes] = PrivateAttr(None)
 
 
-class TriageResult(BaseModel):
+class TriageResult(TrustedConstructMixin, BaseModel):
     """Result model for ticket triage."""
+    model_config = ConfigDict(use_enum_values=True)
+    
     ticket_id: str
     category: TicketCategory
     priority: Priority
@@ -74,12 +97,25 @@ class TriageResult(BaseModel):
     estimated_resolution_time: Optional[int] = Field(None, description="Estimated resolution time in minutes")
     similar_tickets: Optional[List[str]] = Field(default_factory=list, description="IDs of similar historical tickets")
     
-    class Config:
-        use_enum_values = True
-
-
-class TriageResponse(BaseModel):
+    @field_validator('category', 'priority', 'urgency', 'impact', mode='before')
+    @classmethod
+    def accept_codes(cls, v, info):
+        """Accept integer codes as well as the string values."""
+        if isinstance(v, str):
+            return _BY_VALUE[info.field_name].get(v, v)
+        if isinstance(v, int) and not isinstance(v, bool):
+            members = _BY_CODE[info.field_name]
+            if 0 <= v < len(members):
+                return members[v]
+        return v
+
+
+class TriageResponse(TrustedConstructMixin, BaseModel):
     """Response model for ticket triage endpoint."""
+    trusted_nested: ClassVar[Dict[str, type]] = {"result": TriageResult}
+    # Child model instances are kept by reference, not copied or revalidated
+    model_config = ConfigDict(revalidate_instances='never')
+    
     success: bool
     result: Optional[TriageResult] = None
     error: Optional[str] = None
@@ -89,6 +125,8 @@ class TriageResponse(BaseModel):
 
 class CategoryConfidence(BaseModel):
     """Category classification with confidence score."""
+    model_config = ConfigDict(frozen=True)
+    
     category: TicketCategory
     confidence: float = Field(..., ge=0.0, le=1.0)
     reasoning: str
@@ -96,7 +134,15 @@ class CategoryConfidence(BaseModel):
 
 class PriorityMatrix(BaseModel):
     """Priority calculation based on urgency and impact."""
+    model_config = ConfigDict(frozen=True)
+    
     urgency: Urgency
     impact: Impact
     priority: Priority
-    reasoning: str
\ No newline at end of file
+    reasoning: str
+
+
+# Compiled validators for hot paths: validate_python(dict) / validate_json(bytes)
+VALIDATORS = {
+    "TriageResult": TypeAdapter(TriageResult),
+}
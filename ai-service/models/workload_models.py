@@ -0,0 +1,14 @@
+"""Pydantic models for workload optimization."""
+from typing import List, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class WorkloadOptimizationRequest(BaseModel):
+    """Request model for workload optimization."""
+    technicians: List[Dict[str, Any]] = Field(default_factory=list, description="Technician profiles with skills and workload")
+    pending_tickets: List[Dict[str, Any]] = Field(default_factory=list, description="Tickets awaiting assignment")
+    historical_data: Dict[str, Any] = Field(default_factory=dict, description="Historical workload data for forecasting")
+    optimization_goals: List[str] = Field(
+        default_factory=lambda: ['efficiency', 'balance', 'sla_compliance'],
+        description="Objectives to optimize for"
+    )
@@ -1,6 +1,13 @@
 """Service modules."""
-from .triage_service import triage_service
-from .embedding_service import embedding_service
-from .resolution_service import resolution_service
+import importlib
 
-__all__ = ["triage_service", "embedding_service", "resolution_service"]
\ No newline at end of file
+__all__ = ["triage_service", "embedding_service", "resolution_service"]
+
+
+def __getattr__(name):
+    """Import service singletons on first access (PEP 562)."""
+    if name in __all__:
+        service = getattr(importlib.import_module(f".{name}", __name__), name)
+        globals()[name] = service
+        return service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
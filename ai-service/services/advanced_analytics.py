@@ -2,25 +2,32 @@
 Advanced analytics service using TensorFlow and machine learning.
 """
 
+import bisect
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional
 from datetime import datetime, timedelta
 import asyncio
+from collections import Counter
+
+# NumPy is required: the aggregations below are array-based throughout, and a
+# stub would silently return wrong statistics. main.py falls back to its mock
+# analytics service when this module cannot be imported.
+import numpy as np
+NUMPY_AVAILABLE = True  # kept for compatibility; always True here
+
+from services.assignment_matching import SCIPY_AVAILABLE, match_with_slots
 
 # Try to import dependencies with fallbacks
 try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    NUMPY_AVAILABLE = False
-    # Mock numpy for basic operations
-    class MockNumpy:
-        def array(self, data): return data
-        def mean(self, data): return sum(data) / len(data) if data else 0
-        def std(self, data): return 0.1
-        def max(self, data): return max(data) if data else 0
-        def min(self, data): return min(data) if data else 0
-    np = MockNumpy()
+    NUMBA_AVAILABLE = False
 
 try:
     import pandas as pd
@@ -39,11 +46,242 @@ except ImportError:
             return {"success": False, "error": "TensorFlow models not available"}
         async def classify_ticket(self, *args, **kwargs):
             return {"success": False, "error": "TensorFlow models not available"}
+        async def classify_tickets(self, titles, *args, **kwargs):
+            return [{"success": False, "error": "TensorFlow models not available"}] * len(titles)
     workload_forecasting_model = MockModel()
     ticket_classification_model = MockModel()
 
 logger = logging.getLogger(__name__)
 
+# Read-only lookup tables, built once at import
+_PRIORITY_FACTORS: Mapping[str, float] = MappingProxyType(
+    {"critical": 1.0, "high": 0.8, "medium": 0.6, "low": 0.4}
+)
+# Complexity risk by category and priority (unknown values score 0.5)
+_CATEGORY_RISK: Mapping[str, float] = MappingProxyType({
+    "security": 0.9,
+    "network": 0.8,
+    "hardware": 0.7,
+    "software": 0.6,
+    "database": 0.8,
+    "email": 0.4,
+    "printer": 0.3,
+    "other": 0.5
+})
+_PRIORITY_RISK: Mapping[str, float] = MappingProxyType(
+    {"critical": 1.0, "high": 0.8, "medium": 0.5, "low": 0.2}
+)
+_WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_HIGH_PRIORITIES = ("critical", "high")
+_COMPLEX_CATEGORIES = ("security", "network", "database")
+# Contributing risk factors, one bit each (bit i <-> _RISK_FACTOR_NAMES[i])
+_RISK_FACTOR_NAMES = (
+    "unassigned_ticket",
+    "high_technician_workload",
+    "high_priority",
+    "complex_category",
+    "escalated_ticket"
+)
+_UNASSIGNED_FLAG = 1 << 0
+_ESCALATED_FLAG = 1 << 4
+# Flag word -> factor names, so decoding is a single table lookup
+_RISK_FACTORS_BY_FLAGS = tuple(
+    tuple(name for bit, name in enumerate(_RISK_FACTOR_NAMES) if flags >> bit & 1)
+    for flags in range(1 << len(_RISK_FACTOR_NAMES))
+)
+# Risk scores are computed as arrays from this many tickets upwards
+_VECTORIZE_MIN_TICKETS = 64
+# Lower score bounds of the medium, high and critical risk levels
+_RISK_LEVEL_BOUNDS = (0.4, 0.6, 0.8)
+_RISK_LEVELS = ("low", "medium", "high", "critical")
+# Forecast periods such as "12h", "7d" or "2w"
+_PERIOD_RE = re.compile(r"(\d+)\s*([hdw])", re.IGNORECASE)
+_PERIOD_UNIT_HOURS = MappingProxyType({"h": 1, "d": 24, "w": 24 * 7})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(value: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+
+def _to_datetime(value: Any) -> datetime:
+    """Timestamps arrive as ISO strings or datetimes."""
+    return _parse_ts(value) if isinstance(value, str) else value
+
+
+def _parse_deadline(ticket: Dict[str, Any]) -> Optional[datetime]:
+    """Parsed ``sla_deadline``, or None when it is missing or unparseable."""
+    sla_deadline = ticket.get("sla_deadline")
+    if not sla_deadline:
+        return None
+    try:
+        deadline_dt = _to_datetime(sla_deadline)
+    except Exception:
+        return None
+    return deadline_dt if isinstance(deadline_dt, datetime) else None
+
+
+def _group_stats(values: "np.ndarray", groups: "np.ndarray", n_groups: int):
+    """
+    Per-group count, mean, median and population std in a few vectorized passes.
+    
+    Args:
+        values: float64 samples
+        groups: Group code (0..n_groups-1) for each sample; every group non-empty
+        n_groups: Number of groups
+        
+    Returns:
+        Tuple of Python lists (counts, means, medians, stds), indexed by group code
+    """
+    counts = np.bincount(groups, minlength=n_groups)
+    means = np.bincount(groups, weights=values, minlength=n_groups) / counts
+    deviations = values - means[groups]
+    stds = np.sqrt(np.bincount(groups, weights=deviations * deviations, minlength=n_groups) / counts)
+    
+    # Sort by (group, value) once; each group's median sits at the middle of its slice
+    ordered = values[np.lexsort((values, groups))]
+    starts = np.cumsum(counts) - counts
+    medians = (ordered[starts + (counts - 1) // 2] + ordered[starts + counts // 2]) / 2
+    
+    return counts.tolist(), means.tolist(), medians.tolist(), stds.tolist()
+
+
+def _time_risk_inputs(ticket: Dict[str, Any], deadline_dt: Optional[datetime], now: datetime) -> tuple:
+    """(elapsed seconds, total SLA seconds, valid) for the time risk factor; invalid scores 0.5."""
+    created_at = ticket.get("created_at")
+    if not created_at or deadline_dt is None:
+        return 0.0, 0.0, False
+    try:
+        created_dt = _to_datetime(created_at)
+        total_time = (deadline_dt - created_dt).total_seconds()
+        return (now - created_dt).total_seconds(), total_time, True
+    except Exception:
+        return 0.0, 0.0, False
+
+
+def _risk_scores_numpy(elapsed, total, valid, category_risk, priority_risk, description_length, workload, assigned):
+    """Array form of AdvancedAnalyticsService._calculate_ensemble_risk_score."""
+    progress = np.divide(elapsed, total, out=np.zeros_like(elapsed), where=total > 0)
+    time_factor = np.where(
+        ~valid, 0.5,
+        np.where(total <= 0, 1.0,
+                 # A negative ratio (created in the future) scores 0.5, as in the scalar path
+                 np.where(progress < 0, 0.5, np.minimum(1.0, np.abs(progress) ** 1.5)))
+    )
+    complexity_factor = (category_risk + priority_risk + np.minimum(0.3, description_length / 1000)) / 3
+    workload_factor = np.where(assigned, np.minimum(1.0, workload * 1.2), 0.8)
+    return np.clip(time_factor * 0.4 + complexity_factor * 0.3 + workload_factor * 0.3, 0.0, 1.0)
+
+
+if NUMBA_AVAILABLE:
+    # Serial and GIL-free: batches already run concurrently on the analytics executor
+    @njit(cache=True, nogil=True)
+    def _risk_kernel(elapsed, total, valid, category_risk, priority_risk, description_length, workload, assigned):
+        """Compiled equivalent of _risk_scores_numpy."""
+        n = elapsed.shape[0]
+        risk = np.empty(n)
+        for i in range(n):
+            if not valid[i]:
+                time_factor = 0.5
+            elif total[i] <= 0:
+                time_factor = 1.0
+            else:
+                progress = elapsed[i] / total[i]
+                time_factor = 0.5 if progress < 0 else min(1.0, progress ** 1.5)
+            complexity_factor = (category_risk[i] + priority_risk[i] + min(0.3, description_length[i] / 1000)) / 3
+            workload_factor = min(1.0, workload[i] * 1.2) if assigned[i] else 0.8
+            score = time_factor * 0.4 + complexity_factor * 0.3 + workload_factor * 0.3
+            risk[i] = min(1.0, max(0.0, score))
+        return risk
+
+
+class _TicketStats:
+    """Per-ticket aggregates shared by the pattern analyses, filled in one traversal."""
+    
+    __slots__ = (
+        "titles", "descriptions",
+        "hourly", "daily", "monthly",
+        "priority_counts", "sla_performance", "escalations",
+        "resolution_times", "resolution_categories", "resolution_technicians"
+    )
+    
+    def __init__(self):
+        self.titles: List[str] = []
+        self.descriptions: List[str] = []
+        # Tickets created per hour of day (index 0-23)
+        self.hourly: List[int] = [0] * 24
+        # Keyed by weekday() and (year, month); names are formatted once per analysis
+        self.daily: Counter = Counter()
+        self.monthly: Counter = Counter()
+        self.priority_counts: Counter = Counter()
+        self.sla_performance: Dict[str, Dict[str, int]] = {}
+        self.escalations: Counter = Counter()
+        self.resolution_times: List[float] = []
+        self.resolution_categories: List[str] = []
+        self.resolution_technicians: List[str] = []
+
+
+def _single_pass_ticket_stats(
+    tickets: List[Dict[str, Any]],
+    classification: bool = True,
+    temporal: bool = True,
+    priority: bool = True,
+    resolution: bool = True
+) -> _TicketStats:
+    """
+    Walk the tickets once, collecting what the requested analyses need.
+    
+    Args:
+        tickets: Raw ticket dicts
+        classification: Collect titles and descriptions for the classifier
+        temporal: Parse created_at once and count by hour, weekday and month
+        priority: Count priorities, SLA outcomes and escalations
+        resolution: Collect resolution times with category and technician
+        
+    Returns:
+        Filled _TicketStats
+    """
+    stats = _TicketStats()
+    
+    for ticket in tickets:
+        if classification:
+            stats.titles.append(ticket.get("title", ""))
+            stats.descriptions.append(ticket.get("description", ""))
+        
+        status = ticket.get("status", "open")
+        
+        if temporal:
+            created_at = ticket.get("created_at")
+            if created_at:
+                try:
+                    dt = _to_datetime(created_at)
+                    
+                    stats.hourly[dt.hour] += 1
+                    stats.daily[dt.weekday()] += 1
+                    stats.monthly[dt.year, dt.month] += 1
+                    
+                except Exception as e:
+                    logger.warning(f"Failed to parse timestamp: {created_at}")
+        
+        if priority:
+            ticket_priority = ticket.get("priority", "medium")
+            stats.priority_counts[ticket_priority] += 1
+            
+            if status in ("resolved", "closed"):
+                performance = stats.sla_performance.setdefault(ticket_priority, {"met": 0, "missed": 0})
+                performance["met" if ticket.get("sla_met", True) else "missed"] += 1
+            
+            if ticket.get("escalation_level", 0) > 0:
+                stats.escalations[ticket_priority] += 1
+        
+        if resolution and status in ("resolved", "closed"):
+            stats.resolution_times.append(ticket.get("resolution_time_hours", 0))
+            stats.resolution_categories.append(ticket.get("category", "other"))
+            stats.resolution_technicians.append(ticket.get("assigned_technician", "unassigned"))
+    
+    return stats
+
 
 class AdvancedAnalyticsService:
     """Service for advanced analytics using machine learning models."""
@@ -51,6 +289,10 @@ class AdvancedAnalyticsService:
     def __init__(self):
         self.workload_model = workload_forecasting_model
         self.classification_model = ticket_classification_model
+        # Batch scoring runs here; NumPy, SciPy and Numba release the GIL, so calls overlap
+        self._executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="analytics"
+        )
     
     async def predict_workload_trends(
         self, 
@@ -99,25 +341,27 @@ class AdvancedAnalyticsService:
                 "timestamp": datetime.utcnow().isoformat()
             }
             
-            if analysis_type in ["comprehensive", "classification"]:
-                # Advanced classification analysis
-                classification_results = await self._analyze_classification_patterns(tickets)
-                results["classification_analysis"] = classification_results
-            
-            if analysis_type in ["comprehensive", "temporal"]:
-                # Temporal pattern analysis
-                temporal_results = await self._analyze_temporal_patterns(tickets)
-                results["temporal_analysis"] = temporal_results
+            comprehensive = analysis_type == "comprehensive"
+            wanted = {
+                name: comprehensive or analysis_type == name
+                for name in ("classification", "temporal", "priority", "resolution")
+            }
             
-            if analysis_type in ["comprehensive", "priority"]:
-                # Priority and SLA analysis
-                priority_results = await self._analyze_priority_patterns(tickets)
-                results["priority_analysis"] = priority_results
+            # Every analysis reads from one shared traversal of the tickets
+            stats = _single_pass_ticket_stats(tickets, **wanted)
             
-            if analysis_type in ["comprehensive", "resolution"]:
-                # Resolution pattern analysis
-                resolution_results = await self._analyze_resolution_patterns(tickets)
-                results["resolution_analysis"] = resolution_results
+            # Classification (model inference), temporal, priority/SLA and resolution
+            # analyses are independent; the aggregations run while inference is awaited
+            analyzers = {
+                "classification": self._analyze_classification_patterns,
+                "temporal": self._analyze_temporal_patterns,
+                "priority": self._analyze_priority_patterns,
+                "resolution": self._analyze_resolution_patterns
+            }
+            selected = [name for name in analyzers if wanted[name]]
+            analyses = await asyncio.gather(*(analyzers[name](stats) for name in selected))
+            for name, analysis in zip(selected, analyses):
+                results[f"{name}_analysis"] = analysis
             
             # Generate insights and recommendations
             insights = await self._generate_pattern_insights(results)
@@ -136,47 +380,21 @@ class AdvancedAnalyticsService:
     async def predict_sla_risks(
         self, 
         active_tickets: List[Dict[str, Any]], 
-        risk_threshold: float = 0.7
+        risk_threshold: float = 0.7,
+        top_k: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Predict SLA risks using ensemble of ML models."""
+        """
+        Predict SLA risks using ensemble of ML models.
+        
+        With ``top_k`` set, only the K riskiest tickets get full predictions;
+        counts and the risk summary still cover every ticket.
+        """
         try:
-            risk_predictions = []
-            high_risk_tickets = []
-            
-            for ticket in active_tickets:
-                # Use multiple models for risk prediction
-                risk_score = await self._calculate_ensemble_risk_score(ticket)
-                
-                risk_prediction = {
-                    "ticket_id": ticket.get("id", "unknown"),
-                    "title": ticket.get("title", ""),
-                    "risk_score": risk_score,
-                    "risk_level": self._get_risk_level(risk_score),
-                    "predicted_breach_time": self._predict_breach_time(ticket, risk_score),
-                    "contributing_factors": self._identify_risk_factors(ticket, risk_score)
-                }
-                
-                risk_predictions.append(risk_prediction)
-                
-                if risk_score >= risk_threshold:
-                    high_risk_tickets.append(risk_prediction)
-            
-            # Sort by risk score
-            risk_predictions.sort(key=lambda x: x["risk_score"], reverse=True)
-            
-            # Generate risk summary
-            risk_summary = self._generate_risk_summary(risk_predictions, risk_threshold)
-            
-            return {
-                "success": True,
-                "total_tickets": len(active_tickets),
-                "risk_threshold": risk_threshold,
-                "high_risk_count": len(high_risk_tickets),
-                "risk_predictions": risk_predictions,
-                "high_risk_tickets": high_risk_tickets,
-                "risk_summary": risk_summary,
-                "recommendations": self._generate_risk_recommendations(high_risk_tickets)
-            }
+            # One clock reading for the whole batch
+            now = datetime.utcnow()
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._compute_risk_predictions_sync, active_tickets, now, risk_threshold, top_k
+            )
             
         except Exception as e:
             logger.error(f"SLA risk prediction failed: {str(e)}")
@@ -185,6 +403,89 @@ class AdvancedAnalyticsService:
                 "error": str(e)
             }
     
+    def _compute_risk_predictions_sync(
+        self,
+        tickets: List[Dict[str, Any]],
+        now: datetime,
+        risk_threshold: float,
+        top_k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Score and summarize SLA risk for a batch of tickets.
+        
+        Runs on the analytics executor; callers must not mutate ``tickets``
+        while the call is in flight.
+        """
+        risk_predictions = []
+        high_risk_tickets = []
+        unassigned_count = 0
+        escalated_count = 0
+        
+        # Deadlines are parsed once and shared by risk scoring and breach estimates
+        deadlines = [_parse_deadline(ticket) for ticket in tickets]
+        
+        # Use multiple models for risk prediction
+        risk_scores = self._calculate_risk_scores(tickets, deadlines, now)
+        
+        partial = top_k is not None and 0 <= top_k < len(tickets)
+        if partial:
+            # O(N) selection of the K riskiest tickets; only those are ranked and expanded
+            scores = np.asarray(risk_scores, dtype=np.float64)
+            top = np.argpartition(-scores, top_k)[:top_k]
+            order = top[np.argsort(-scores[top], kind="stable")].tolist()
+            ranked = [(tickets[i], deadlines[i], risk_scores[i]) for i in order]
+            
+            # Recommendation counts cover every high-risk ticket, not just the K emitted
+            for i in np.flatnonzero(scores >= risk_threshold).tolist():
+                flags = self._risk_factor_flags(tickets[i])
+                unassigned_count += flags & _UNASSIGNED_FLAG
+                escalated_count += (flags & _ESCALATED_FLAG) >> 4
+        else:
+            ranked = zip(tickets, deadlines, risk_scores)
+        
+        for ticket, deadline_dt, risk_score in ranked:
+            flags = self._risk_factor_flags(ticket)
+            risk_prediction = {
+                "ticket_id": ticket.get("id", "unknown"),
+                "title": ticket.get("title", ""),
+                "risk_score": risk_score,
+                "risk_level": self._get_risk_level(risk_score),
+                "predicted_breach_time": self._predict_breach_time(deadline_dt, risk_score, now),
+                "contributing_factors": list(_RISK_FACTORS_BY_FLAGS[flags])
+            }
+            
+            risk_predictions.append(risk_prediction)
+            
+            if risk_score >= risk_threshold:
+                high_risk_tickets.append(risk_prediction)
+                if not partial:
+                    unassigned_count += flags & _UNASSIGNED_FLAG
+                    escalated_count += (flags & _ESCALATED_FLAG) >> 4
+        
+        if partial:
+            high_risk_count = int(np.count_nonzero(scores >= risk_threshold))
+            risk_summary = self._summarize_risk_scores(scores, risk_threshold)
+        else:
+            # Sort by risk score
+            risk_predictions.sort(key=lambda x: x["risk_score"], reverse=True)
+            high_risk_count = len(high_risk_tickets)
+            
+            # Generate risk summary
+            risk_summary = self._generate_risk_summary(risk_predictions, risk_threshold)
+        
+        return {
+            "success": True,
+            "total_tickets": len(tickets),
+            "risk_threshold": risk_threshold,
+            "high_risk_count": high_risk_count,
+            "risk_predictions": risk_predictions,
+            "high_risk_tickets": high_risk_tickets,
+            "risk_summary": risk_summary,
+            "recommendations": self._generate_risk_recommendations(
+                high_risk_count, unassigned_count, escalated_count
+            )
+        }
+    
     async def optimize_technician_assignments(
         self, 
         technicians: List[Dict[str, Any]], 
@@ -231,67 +532,52 @@ class AdvancedAnalyticsService:
         
         return prediction_result
     
-    async def _analyze_classification_patterns(self, tickets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_classification_patterns(self, stats: _TicketStats) -> Dict[str, Any]:
         """Analyze ticket classification patterns using ML."""
-        classification_results = []
-        category_distribution = {}
-        confidence_scores = []
+        # One batched model call for all tickets instead of one await per ticket
+        results = await self.classification_model.classify_tickets(
+            stats.titles, stats.descriptions, batch_size=64
+        )
         
-        for ticket in tickets:
-            title = ticket.get("title", "")
-            description = ticket.get("description", "")
-            
-            # Use TensorFlow model for classification
-            result = await self.classification_model.classify_ticket(title, description)
-            
-            if result.get("success"):
-                classification_results.append(result)
-                
-                category = result.get("predicted_category", "other")
-                category_distribution[category] = category_distribution.get(category, 0) + 1
-                
-                confidence_scores.append(result.get("confidence_score", 0))
+        # One streaming pass over the results; no per-ticket score list is kept
+        category_distribution: Counter = Counter()
+        classified = 0
+        confidence_sum = 0.0
+        low_confidence = 0
+        high_confidence = 0
+        for result in results:
+            if not result.get("success"):
+                continue
+            score = result.get("confidence_score", 0)
+            category_distribution[result.get("predicted_category", "other")] += 1
+            classified += 1
+            confidence_sum += score
+            low_confidence += score < 0.6
+            high_confidence += score > 0.8
+        
+        average_confidence = confidence_sum / classified if classified else 0
         
         return {
-            "total_classified": len(classification_results),
-            "category_distribution": category_distribution,
-            "average_confidence": np.mean(confidence_scores) if confidence_scores else 0,
-            "low_confidence_count": sum(1 for score in confidence_scores if score < 0.6),
+            "total_classified": classified,
+            "category_distribution": dict(category_distribution),
+            "average_confidence": average_confidence,
+            "low_confidence_count": low_confidence,
             "model_performance": {
-                "high_confidence_rate": sum(1 for score in confidence_scores if score > 0.8) / max(1, len(confidence_scores)),
-                "average_confidence": np.mean(confidence_scores) if confidence_scores else 0
+                "high_confidence_rate": high_confidence / max(1, classified),
+                "average_confidence": average_confidence
             }
         }
     
-    async def _analyze_temporal_patterns(self, tickets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_temporal_patterns(self, stats: _TicketStats) -> Dict[str, Any]:
         """Analyze temporal patterns in ticket data."""
-        hourly_distribution = {}
-        daily_distribution = {}
-        monthly_trends = {}
-        
-        for ticket in tickets:
-            created_at = ticket.get("created_at")
-            if created_at:
-                try:
-                    if isinstance(created_at, str):
-                        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    else:
-                        dt = created_at
-                    
-                    hour = dt.hour
-                    day = dt.strftime("%A")
-                    month = dt.strftime("%Y-%m")
-                    
-                    hourly_distribution[hour] = hourly_distribution.get(hour, 0) + 1
-                    daily_distribution[day] = daily_distribution.get(day, 0) + 1
-                    monthly_trends[month] = monthly_trends.get(month, 0) + 1
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse timestamp: {created_at}")
+        hour_hist = np.array(stats.hourly, dtype=np.int64)
+        hourly_distribution = {hour: count for hour, count in enumerate(stats.hourly) if count}
+        daily_distribution = {_WEEKDAY_NAMES[day]: count for day, count in stats.daily.items()}
+        monthly_trends = {f"{year:04d}-{month:02d}": count for (year, month), count in stats.monthly.items()}
         
         # Identify peak hours and days
-        peak_hour = max(hourly_distribution, key=hourly_distribution.get) if hourly_distribution else None
-        peak_day = max(daily_distribution, key=daily_distribution.get) if daily_distribution else None
+        peak_hour = int(hour_hist.argmax()) if hour_hist.any() else None
+        peak_day = _WEEKDAY_NAMES[stats.daily.most_common(1)[0][0]] if stats.daily else None
         
         return {
             "hourly_distribution": hourly_distribution,
@@ -299,34 +585,14 @@ class AdvancedAnalyticsService:
             "monthly_trends": monthly_trends,
             "peak_hour": peak_hour,
             "peak_day": peak_day,
-            "business_hours_percentage": self._calculate_business_hours_percentage(hourly_distribution)
+            "business_hours_percentage": self._calculate_business_hours_percentage(hour_hist)
         }
     
-    async def _analyze_priority_patterns(self, tickets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_priority_patterns(self, stats: _TicketStats) -> Dict[str, Any]:
         """Analyze priority and SLA patterns."""
-        priority_distribution = {}
-        sla_performance = {}
-        escalation_patterns = {}
-        
-        for ticket in tickets:
-            priority = ticket.get("priority", "medium")
-            status = ticket.get("status", "open")
-            escalation_level = ticket.get("escalation_level", 0)
-            
-            priority_distribution[priority] = priority_distribution.get(priority, 0) + 1
-            
-            if status in ["resolved", "closed"]:
-                sla_met = ticket.get("sla_met", True)
-                if priority not in sla_performance:
-                    sla_performance[priority] = {"met": 0, "missed": 0}
-                
-                if sla_met:
-                    sla_performance[priority]["met"] += 1
-                else:
-                    sla_performance[priority]["missed"] += 1
-            
-            if escalation_level > 0:
-                escalation_patterns[priority] = escalation_patterns.get(priority, 0) + 1
+        priority_distribution = dict(stats.priority_counts)
+        sla_performance = stats.sla_performance
+        escalation_patterns = dict(stats.escalations)
         
         # Calculate SLA compliance rates
         sla_compliance = {}
@@ -342,43 +608,44 @@ class AdvancedAnalyticsService:
             "overall_sla_compliance": np.mean(list(sla_compliance.values())) if sla_compliance else 0
         }
     
-    async def _analyze_resolution_patterns(self, tickets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_resolution_patterns(self, stats: _TicketStats) -> Dict[str, Any]:
         """Analyze resolution patterns and efficiency."""
-        resolution_times = {}
-        technician_performance = {}
         category_efficiency = {}
-        
-        for ticket in tickets:
-            if ticket.get("status") in ["resolved", "closed"]:
-                category = ticket.get("category", "other")
-                technician = ticket.get("assigned_technician", "unassigned")
-                resolution_time = ticket.get("resolution_time_hours", 0)
-                
-                if category not in resolution_times:
-                    resolution_times[category] = []
-                resolution_times[category].append(resolution_time)
-                
-                if technician not in technician_performance:
-                    technician_performance[technician] = []
-                technician_performance[technician].append(resolution_time)
-        
-        # Calculate averages
-        for category, times in resolution_times.items():
-            category_efficiency[category] = {
-                "average_hours": np.mean(times),
-                "median_hours": np.median(times),
-                "std_dev": np.std(times),
-                "ticket_count": len(times)
-            }
-        
         tech_efficiency = {}
-        for tech, times in technician_performance.items():
-            if len(times) >= 3:  # Only include techs with sufficient data
-                tech_efficiency[tech] = {
-                    "average_hours": np.mean(times),
-                    "ticket_count": len(times),
-                    "efficiency_score": 1 / (np.mean(times) + 1)  # Higher score for faster resolution
+        
+        count = len(stats.resolution_times)
+        if count:
+            # Contiguous time array plus integer group codes (first-seen order)
+            category_codes: Dict[str, int] = {}
+            technician_codes: Dict[str, int] = {}
+            times = np.array(stats.resolution_times, dtype=np.float64)
+            category_idx = np.fromiter(
+                (category_codes.setdefault(category, len(category_codes)) for category in stats.resolution_categories),
+                dtype=np.intp, count=count
+            )
+            technician_idx = np.fromiter(
+                (technician_codes.setdefault(tech, len(technician_codes)) for tech in stats.resolution_technicians),
+                dtype=np.intp, count=count
+            )
+            
+            counts, means, medians, stds = _group_stats(times, category_idx, len(category_codes))
+            for category, n, mean, median, std in zip(category_codes, counts, means, medians, stds):
+                category_efficiency[category] = {
+                    "average_hours": mean,
+                    "median_hours": median,
+                    "std_dev": std,
+                    "ticket_count": n
                 }
+            
+            tech_counts = np.bincount(technician_idx, minlength=len(technician_codes))
+            tech_means = np.bincount(technician_idx, weights=times, minlength=len(technician_codes)) / tech_counts
+            for tech, n, mean in zip(technician_codes, tech_counts.tolist(), tech_means.tolist()):
+                if n >= 3:  # Only include techs with sufficient data
+                    tech_efficiency[tech] = {
+                        "average_hours": mean,
+                        "ticket_count": n,
+                        "efficiency_score": 1 / (mean + 1)  # Higher score for faster resolution
+                    }
         
         return {
             "category_efficiency": category_efficiency,
@@ -421,30 +688,76 @@ class AdvancedAnalyticsService:
         
         return insights
     
-    def _parse_forecast_period(self, period: str) -> int:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_forecast_period(period: str) -> int:
         """Parse forecast period string to hours."""
-        period = period.lower()
-        if period.endswith('h'):
-            return int(period[:-1])
-        elif period.endswith('d'):
-            return int(period[:-1]) * 24
-        elif period.endswith('w'):
-            return int(period[:-1]) * 24 * 7
-        else:
+        match = _PERIOD_RE.fullmatch(period.strip())
+        if not match:
             return 24  # Default to 24 hours
+        return int(match[1]) * _PERIOD_UNIT_HOURS[match[2].lower()]
+    
+    def _calculate_business_hours_percentage(self, hour_hist: "np.ndarray") -> float:
+        """Calculate percentage of tickets created during business hours (9 AM to 5 PM)."""
+        total_tickets = int(hour_hist.sum())
+        return int(hour_hist[9:18].sum()) / total_tickets if total_tickets > 0 else 0
     
-    def _calculate_business_hours_percentage(self, hourly_distribution: Dict[int, int]) -> float:
-        """Calculate percentage of tickets created during business hours."""
-        business_hours = range(9, 18)  # 9 AM to 5 PM
-        business_tickets = sum(hourly_distribution.get(hour, 0) for hour in business_hours)
-        total_tickets = sum(hourly_distribution.values())
+    def _calculate_risk_scores(
+        self,
+        tickets: List[Dict[str, Any]],
+        deadlines: List[Optional[datetime]],
+        now: datetime
+    ) -> List[float]:
+        """
+        Ensemble risk score for every ticket.
+        
+        Large batches are gathered into column arrays and scored in one
+        pass (compiled with Numba when available); small ones use the
+        scalar scorer.
+        """
+        if len(tickets) < _VECTORIZE_MIN_TICKETS:
+            return [
+                self._calculate_ensemble_risk_score(ticket, deadline_dt, now)
+                for ticket, deadline_dt in zip(tickets, deadlines)
+            ]
+        
+        n = len(tickets)
+        time_inputs = [
+            _time_risk_inputs(ticket, deadline_dt, now) for ticket, deadline_dt in zip(tickets, deadlines)
+        ]
+        elapsed = np.fromiter((item[0] for item in time_inputs), dtype=np.float64, count=n)
+        total = np.fromiter((item[1] for item in time_inputs), dtype=np.float64, count=n)
+        valid = np.fromiter((item[2] for item in time_inputs), dtype=np.bool_, count=n)
+        category_risk = np.fromiter(
+            (_CATEGORY_RISK.get(ticket.get("category", "other"), 0.5) for ticket in tickets), dtype=np.float64, count=n
+        )
+        priority_risk = np.fromiter(
+            (_PRIORITY_RISK.get(ticket.get("priority", "medium"), 0.5) for ticket in tickets), dtype=np.float64, count=n
+        )
+        description_length = np.fromiter(
+            (len(ticket.get("description", "")) for ticket in tickets), dtype=np.float64, count=n
+        )
+        workload = np.fromiter(
+            (ticket.get("technician_workload", 0.5) for ticket in tickets), dtype=np.float64, count=n
+        )
+        assigned = np.fromiter(
+            (ticket.get("assigned_technician") is not None for ticket in tickets), dtype=np.bool_, count=n
+        )
         
-        return business_tickets / total_tickets if total_tickets > 0 else 0
+        score_fn = _risk_kernel if NUMBA_AVAILABLE else _risk_scores_numpy
+        return score_fn(
+            elapsed, total, valid, category_risk, priority_risk, description_length, workload, assigned
+        ).tolist()
     
-    async def _calculate_ensemble_risk_score(self, ticket: Dict[str, Any]) -> float:
+    def _calculate_ensemble_risk_score(
+        self,
+        ticket: Dict[str, Any],
+        deadline_dt: Optional[datetime],
+        now: datetime
+    ) -> float:
         """Calculate risk score using ensemble of models."""
         # Combine multiple risk factors
-        time_factor = self._calculate_time_risk_factor(ticket)
+        time_factor = self._calculate_time_risk_factor(ticket, deadline_dt, now)
         complexity_factor = self._calculate_complexity_risk_factor(ticket)
         workload_factor = self._calculate_workload_risk_factor(ticket)
         
@@ -457,27 +770,23 @@ class AdvancedAnalyticsService:
         
         return min(1.0, max(0.0, risk_score))
     
-    def _calculate_time_risk_factor(self, ticket: Dict[str, Any]) -> float:
-        """Calculate risk factor based on time constraints."""
+    def _calculate_time_risk_factor(
+        self,
+        ticket: Dict[str, Any],
+        deadline_dt: Optional[datetime],
+        now: datetime
+    ) -> float:
+        """Calculate risk factor based on time constraints (``deadline_dt`` from _parse_deadline)."""
         created_at = ticket.get("created_at")
-        sla_deadline = ticket.get("sla_deadline")
         
-        if not created_at or not sla_deadline:
+        if not created_at or deadline_dt is None:
             return 0.5  # Default moderate risk
         
         try:
-            if isinstance(created_at, str):
-                created_dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            else:
-                created_dt = created_at
-                
-            if isinstance(sla_deadline, str):
-                deadline_dt = datetime.fromisoformat(sla_deadline.replace('Z', '+00:00'))
-            else:
-                deadline_dt = sla_deadline
+            created_dt = _to_datetime(created_at)
             
             total_time = (deadline_dt - created_dt).total_seconds()
-            elapsed_time = (datetime.utcnow() - created_dt).total_seconds()
+            elapsed_time = (now - created_dt).total_seconds()
             
             if total_time <= 0:
                 return 1.0  # Already past deadline
@@ -494,28 +803,8 @@ class AdvancedAnalyticsService:
         priority = ticket.get("priority", "medium")
         description_length = len(ticket.get("description", ""))
         
-        # Category complexity scores
-        category_scores = {
-            "security": 0.9,
-            "network": 0.8,
-            "hardware": 0.7,
-            "software": 0.6,
-            "database": 0.8,
-            "email": 0.4,
-            "printer": 0.3,
-            "other": 0.5
-        }
-        
-        # Priority scores
-        priority_scores = {
-            "critical": 1.0,
-            "high": 0.8,
-            "medium": 0.5,
-            "low": 0.2
-        }
-        
-        category_risk = category_scores.get(category, 0.5)
-        priority_risk = priority_scores.get(priority, 0.5)
+        category_risk = _CATEGORY_RISK.get(category, 0.5)
+        priority_risk = _PRIORITY_RISK.get(priority, 0.5)
         
         # Longer descriptions might indicate more complex issues
         length_risk = min(0.3, description_length / 1000)
@@ -535,34 +824,26 @@ class AdvancedAnalyticsService:
     
     def _get_risk_level(self, risk_score: float) -> str:
         """Convert risk score to risk level."""
-        if risk_score >= 0.8:
-            return "critical"
-        elif risk_score >= 0.6:
-            return "high"
-        elif risk_score >= 0.4:
-            return "medium"
-        else:
-            return "low"
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_LEVEL_BOUNDS, risk_score)]
     
-    def _predict_breach_time(self, ticket: Dict[str, Any], risk_score: float) -> Optional[str]:
-        """Predict when SLA breach might occur."""
-        sla_deadline = ticket.get("sla_deadline")
-        if not sla_deadline:
+    def _predict_breach_time(
+        self,
+        deadline_dt: Optional[datetime],
+        risk_score: float,
+        now: datetime
+    ) -> Optional[str]:
+        """Predict when SLA breach might occur (``deadline_dt`` from _parse_deadline)."""
+        if deadline_dt is None:
             return None
         
         try:
-            if isinstance(sla_deadline, str):
-                deadline_dt = datetime.fromisoformat(sla_deadline.replace('Z', '+00:00'))
-            else:
-                deadline_dt = sla_deadline
-            
             # Estimate breach time based on risk score
             if risk_score >= 0.8:
                 # High risk - might breach soon
-                breach_time = datetime.utcnow() + timedelta(hours=1)
+                breach_time = now + timedelta(hours=1)
             elif risk_score >= 0.6:
                 # Medium-high risk
-                breach_time = datetime.utcnow() + timedelta(hours=4)
+                breach_time = now + timedelta(hours=4)
             else:
                 # Lower risk - use SLA deadline
                 breach_time = deadline_dt
@@ -572,36 +853,22 @@ class AdvancedAnalyticsService:
         except Exception:
             return None
     
-    def _identify_risk_factors(self, ticket: Dict[str, Any], risk_score: float) -> List[str]:
-        """Identify contributing risk factors."""
-        factors = []
-        
-        if not ticket.get("assigned_technician"):
-            factors.append("unassigned_ticket")
-        
-        if ticket.get("technician_workload", 0) > 0.8:
-            factors.append("high_technician_workload")
-        
-        if ticket.get("priority") in ["critical", "high"]:
-            factors.append("high_priority")
-        
-        if ticket.get("category") in ["security", "network", "database"]:
-            factors.append("complex_category")
-        
-        if ticket.get("escalation_level", 0) > 0:
-            factors.append("escalated_ticket")
-        
-        return factors
+    def _risk_factor_flags(self, ticket: Dict[str, Any]) -> int:
+        """Contributing risk factors as a flag word; decode with _RISK_FACTORS_BY_FLAGS."""
+        return (
+            (not ticket.get("assigned_technician"))
+            | (ticket.get("technician_workload", 0) > 0.8) << 1
+            | (ticket.get("priority") in _HIGH_PRIORITIES) << 2
+            | (ticket.get("category") in _COMPLEX_CATEGORIES) << 3
+            | (ticket.get("escalation_level", 0) > 0) << 4
+        )
     
     def _generate_risk_summary(self, risk_predictions: List[Dict[str, Any]], threshold: float) -> Dict[str, Any]:
         """Generate summary of risk analysis."""
         total = len(risk_predictions)
         high_risk = sum(1 for p in risk_predictions if p["risk_score"] >= threshold)
         
-        risk_levels = {}
-        for prediction in risk_predictions:
-            level = prediction["risk_level"]
-            risk_levels[level] = risk_levels.get(level, 0) + 1
+        risk_levels = dict(Counter(p["risk_level"] for p in risk_predictions))
         
         return {
             "total_tickets": total,
@@ -610,21 +877,41 @@ class AdvancedAnalyticsService:
             "average_risk_score": np.mean([p["risk_score"] for p in risk_predictions]) if risk_predictions else 0
         }
     
-    def _generate_risk_recommendations(self, high_risk_tickets: List[Dict[str, Any]]) -> List[str]:
-        """Generate recommendations for high-risk tickets."""
-        if not high_risk_tickets:
+    def _summarize_risk_scores(self, scores: "np.ndarray", threshold: float) -> Dict[str, Any]:
+        """_generate_risk_summary computed directly from the score array."""
+        total = len(scores)
+        level_counts = np.bincount(
+            np.searchsorted(_RISK_LEVEL_BOUNDS, scores, side="right"), minlength=len(_RISK_LEVELS)
+        ).tolist()
+        
+        return {
+            "total_tickets": total,
+            "high_risk_percentage": int(np.count_nonzero(scores >= threshold)) / total if total > 0 else 0,
+            # Most severe level first, matching the order of the sorted predictions
+            "risk_level_distribution": {
+                level: count for level, count in zip(reversed(_RISK_LEVELS), reversed(level_counts)) if count
+            },
+            "average_risk_score": np.mean(scores) if total else 0
+        }
+    
+    def _generate_risk_recommendations(
+        self,
+        high_risk_count: int,
+        unassigned_count: int,
+        escalated_count: int
+    ) -> List[str]:
+        """Generate recommendations from high-risk ticket counts."""
+        if not high_risk_count:
             return ["No high-risk tickets identified - maintain current monitoring"]
         
         recommendations = []
         
-        if len(high_risk_tickets) > 5:
+        if high_risk_count > 5:
             recommendations.append("Multiple high-risk tickets detected - consider emergency staffing")
         
-        unassigned_count = sum(1 for t in high_risk_tickets if "unassigned_ticket" in t.get("contributing_factors", []))
         if unassigned_count > 0:
             recommendations.append(f"Assign {unassigned_count} high-risk unassigned tickets immediately")
         
-        escalated_count = sum(1 for t in high_risk_tickets if "escalated_ticket" in t.get("contributing_factors", []))
         if escalated_count > 0:
             recommendations.append(f"Review {escalated_count} escalated high-risk tickets for management attention")
         
@@ -636,33 +923,39 @@ class AdvancedAnalyticsService:
         pending_tickets: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """ML-enhanced assignment optimization."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._compute_assignments_sync, technicians, pending_tickets
+        )
+    
+    def _compute_assignments_sync(
+        self,
+        technicians: List[Dict[str, Any]],
+        pending_tickets: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Score and match every pending ticket against the technicians.
+        
+        Runs on the analytics executor; callers must not mutate the inputs
+        while the call is in flight.
+        """
         # This would use more sophisticated ML models
         # For now, implement enhanced rule-based optimization
         
-        assignments = []
-        optimization_score = 0.0
-        
-        # Score each technician-ticket pair
-        for ticket in pending_tickets:
-            best_technician = None
-            best_score = -1
-            
-            for technician in technicians:
-                score = await self._calculate_assignment_score(technician, ticket)
-                if score > best_score:
-                    best_score = score
-                    best_technician = technician
-            
-            if best_technician:
-                assignments.append({
-                    "ticket_id": ticket.get("id"),
-                    "technician_id": best_technician.get("id"),
-                    "assignment_score": best_score,
-                    "reasoning": "ML-enhanced skill and workload matching"
-                })
-                optimization_score += best_score
+        if not technicians or not pending_tickets:
+            choices = []
+        else:
+            choices = self._match_assignments(self._assignment_score_matrix(technicians, pending_tickets))
         
-        optimization_score = optimization_score / len(assignments) if assignments else 0
+        assignments = [
+            {
+                "ticket_id": ticket.get("id"),
+                "technician_id": technicians[tech_index].get("id"),
+                "assignment_score": score,
+                "reasoning": "ML-enhanced skill and workload matching"
+            }
+            for ticket, (tech_index, score) in zip(pending_tickets, choices)
+        ]
+        optimization_score = sum(score for _, score in choices) / len(choices) if choices else 0
         
         return {
             "success": True,
@@ -698,7 +991,81 @@ class AdvancedAnalyticsService:
             "total_assignments": len(assignments)
         }
     
-    async def _calculate_assignment_score(
+    def _assignment_score_matrix(
+        self,
+        technicians: List[Dict[str, Any]],
+        pending_tickets: List[Dict[str, Any]]
+    ) -> "np.ndarray":
+        """
+        Score every (ticket, technician) pair at once; same formula as _calculate_assignment_score.
+        
+        Returns:
+            Array of shape (tickets, technicians) with scores in [0, 1]
+        """
+        skill_index: Dict[str, int] = {}
+        for technician in technicians:
+            for skill in technician.get("skills", []):
+                skill_index.setdefault(skill, len(skill_index))
+        
+        tech_skills = np.zeros((len(technicians), max(1, len(skill_index))), dtype=np.uint8)
+        for row, technician in enumerate(technicians):
+            for skill in technician.get("skills", []):
+                tech_skills[row, skill_index[skill]] = 1
+        
+        # Required skills no technician has still count towards the denominator
+        ticket_skills = np.zeros((len(pending_tickets), tech_skills.shape[1]), dtype=np.uint8)
+        required_counts = np.zeros(len(pending_tickets), dtype=np.float64)
+        for row, ticket in enumerate(pending_tickets):
+            required = set(ticket.get("required_skills", []))
+            required_counts[row] = len(required)
+            for skill in required:
+                column = skill_index.get(skill)
+                if column is not None:
+                    ticket_skills[row, column] = 1
+        
+        # Overlap counts are small integers, exact in float32; the product is the
+        # largest array here, so it runs in single precision and widens afterwards
+        matches = (ticket_skills.astype(np.float32) @ tech_skills.T.astype(np.float32)).astype(np.float64)
+        skill_match = np.where(
+            required_counts[:, None] > 0,
+            matches / np.maximum(required_counts, 1)[:, None],
+            0.5
+        )
+        workload_factor = 1.0 - np.array([t.get("current_workload", 0.5) for t in technicians], dtype=np.float64)
+        experience = np.array([t.get("experience_level", 5) for t in technicians], dtype=np.float64) / 10.0
+        priority_factor = np.array(
+            [_PRIORITY_FACTORS.get(t.get("priority", "medium"), 0.6) for t in pending_tickets], dtype=np.float64
+        )
+        
+        score = (
+            skill_match * 0.4 +
+            workload_factor[None, :] * 0.3 +
+            priority_factor[:, None] * 0.2 +
+            experience[None, :] * 0.1
+        )
+        return np.clip(score, 0.0, 1.0)
+    
+    def _match_assignments(self, score: "np.ndarray") -> List[tuple]:
+        """
+        Assign each ticket a technician from a (tickets, technicians) score matrix.
+        
+        With SciPy, technicians are replicated ceil(tickets / technicians)
+        times and the Hungarian algorithm maximizes the total score, so
+        tickets are spread evenly instead of all going to the top scorer.
+        Otherwise (or for very large inputs) each ticket takes its best
+        technician.
+        
+        Returns:
+            (technician index, score) per ticket
+        """
+        n_tickets, n_technicians = score.shape
+        # Enough slots for every ticket, so none is left unmatched
+        best = match_with_slots(score, np.full(n_technicians, -(-n_tickets // n_technicians)))
+        if best is None:
+            best = score.argmax(axis=1)
+        return list(zip(best.tolist(), score[np.arange(n_tickets), best].tolist()))
+    
+    def _calculate_assignment_score(
         self, 
         technician: Dict[str, Any], 
         ticket: Dict[str, Any]
@@ -718,8 +1085,7 @@ class AdvancedAnalyticsService:
         workload_factor = 1.0 - current_workload
         
         # Priority factor
-        priority_scores = {"critical": 1.0, "high": 0.8, "medium": 0.6, "low": 0.4}
-        priority_factor = priority_scores.get(ticket.get("priority", "medium"), 0.6)
+        priority_factor = _PRIORITY_FACTORS.get(ticket.get("priority", "medium"), 0.6)
         
         # Experience factor
         experience_level = technician.get("experience_level", 5) / 10.0
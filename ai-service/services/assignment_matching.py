@@ -0,0 +1,40 @@
+"""Capacity-aware ticket to technician matching shared by the workload optimizers."""
+from typing import Optional
+
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Upper bound on the (tickets x technician slots) cost matrix size
+MAX_MATCHING_CELLS = 4_000_000
+
+
+def match_with_slots(score: np.ndarray, slots: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Maximize the total score with each technician limited to a number of tickets.
+
+    Technician ``n`` is replicated ``slots[n]`` times (capped at the ticket
+    count) and the Hungarian algorithm assigns tickets to the replicas.
+
+    Args:
+        score: (tickets, technicians) score matrix
+        slots: Non-negative ticket capacity per technician
+
+    Returns:
+        Technician index per ticket, -1 for tickets left over once every
+        slot is taken; None when SciPy is unavailable, there are no slots,
+        or the replicated matrix would exceed MAX_MATCHING_CELLS
+    """
+    n_tickets = score.shape[0]
+    slot_owner = np.repeat(np.arange(score.shape[1]), np.minimum(slots, n_tickets))
+    if not SCIPY_AVAILABLE or slot_owner.size == 0 or slot_owner.size * n_tickets > MAX_MATCHING_CELLS:
+        return None
+
+    rows, columns = linear_sum_assignment(score[:, slot_owner], maximize=True)
+    best = np.full(n_tickets, -1, dtype=np.intp)
+    best[rows] = slot_owner[columns]
+    return best
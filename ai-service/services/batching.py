@@ -0,0 +1,99 @@
+"""Micro-batching for model inference calls."""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single-item calls into one batched call.
+
+    Items submitted within ``max_wait`` seconds of each other (up to
+    ``max_batch`` of them) are passed to the handler together, and each
+    caller receives its own result.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 32,
+        max_wait: float = 0.010
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            handler: Async callable mapping a list of items to a list of results
+            max_batch: Maximum number of items per handler call
+            max_wait: Seconds to wait for more items after the first arrives
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result.
+
+        Args:
+            item: Single handler input
+
+        Returns:
+            The handler's result for this item
+        """
+        # Created lazily so the queue and worker bind to the serving event loop;
+        # neither can be used from another loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+        # A restarted worker keeps draining the same queue, so queued items are not lost
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one item, then gather more until the batch is full or the window closes."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """Single consumer loop feeding batches to the handler."""
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+            try:
+                results = list(await self.handler(items))
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"Batch handler returned {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                logger.error(f"Batched call of {len(items)} items failed: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                # Callers that were cancelled while waiting are skipped
+                if not future.done():
+                    future.set_result(result)
@@ -1,7 +1,7 @@
 """Embedding service for similarity search and vector operations."""
+import asyncio
 import logging
 from typing import List, Dict, Tuple, Optional
-import hashlib
 
 # Try to import numpy with fallback
 try:
@@ -17,12 +17,59 @@ except ImportError:
             return type('obj', (object,), {'norm': lambda x: (sum(i**2 for i in x))**0.5})()
     np = MockNumpy()
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
 from clients.gemini_client import gemini_client
 from cache.redis_cache import redis_cache
-from models.resolution_models import HistoricalTicket, SimilarityMatch
+from cache.local_cache import LocalTTLCache
+from models.base import text_digest
+from models.resolution_models import HistoricalTicket, SimilarityMatch, VALIDATORS
 
 logger = logging.getLogger(__name__)
 
+# Below this many historical tickets an exact matrix scan beats the ANN index
+_ANN_MIN_TICKETS = 2048
+
+
+if NUMBA_AVAILABLE:
+    # fastmath lets LLVM vectorize the dot/norm reductions; serial over rows since
+    # batches are small and callers may already run on worker threads
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _cosine_batch(query, matrix):
+        """Cosine similarity of ``query`` against each row of ``matrix``; 0 for zero vectors."""
+        rows, dim = matrix.shape
+        out = np.zeros(rows, dtype=np.float32)
+        query_norm = np.sqrt(np.sum(query * query))
+        if query_norm == 0:
+            return out
+        for i in range(rows):
+            dot = 0.0
+            norm = 0.0
+            for j in range(dim):
+                value = matrix[i, j]
+                dot += query[j] * value
+                norm += value * value
+            if norm > 0:
+                out[i] = dot / (query_norm * np.sqrt(norm))
+        return out
+
+
+def _normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """Scale rows to unit L2 norm in place; zero rows stay zero (similarity 0)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1, norms)
+    return matrix
+
 
 class EmbeddingService:
     """Service for creating and managing text embeddings."""
@@ -32,9 +79,24 @@ class EmbeddingService:
         self.embedding_model = "text-embedding-ada-002"
         self.embedding_dimension = 1536  # OpenAI ada-002 dimension
         
+        # Text digest -> embedding, checked before Redis
+        # Embeddings are flat lists of floats, so a shallow copy isolates callers
+        self._embedding_lru = LocalTTLCache(maxsize=4096, ttl=86400, copier=list)
+        
         # Mock historical tickets for demonstration
         # In production, this would come from a database
         self.historical_tickets = self._load_mock_historical_tickets()
+        
+        # Unit-norm float32 embeddings of historical_tickets, one row per ticket (built lazily)
+        self._hist_matrix: Optional["np.ndarray"] = None
+        self._hist_matrix_lock = asyncio.Lock()
+        # HNSW index over the same rows (ids are row numbers), for large histories
+        self._ann_index = None
+    
+    def warm_up(self) -> None:
+        """Compile (or load from the on-disk cache) the similarity kernel before the first request."""
+        if NUMBA_AVAILABLE:
+            _cosine_batch(np.ones(1, dtype=np.float32), np.ones((1, 1), dtype=np.float32))
     
     def _load_mock_historical_tickets(self) -> List[HistoricalTicket]:
         """Load mock historical tickets for demonstration."""
@@ -143,37 +205,85 @@ class EmbeddingService:
             }
         ]
         
-        return [HistoricalTicket(**ticket) for ticket in mock_tickets]
+        return VALIDATORS["HistoricalTickets"].validate_python(mock_tickets)
     
-    def _generate_embedding_cache_key(self, text: str) -> str:
+    def _generate_embedding_cache_key(self, text_hash: bytes) -> str:
         """Generate cache key for embedding."""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        return f"embedding:{self.embedding_model}:{text_hash}"
+        return f"embedding:{self.embedding_model}:{text_hash.hex()}"
     
-    async def create_embedding(self, text: str) -> List[float]:
+    async def create_embedding(self, text: str, text_hash: Optional[bytes] = None) -> List[float]:
         """
         Create embedding for text with caching.
         
         Args:
             text: Text to embed
+            text_hash: Precomputed text_digest(text), e.g. a request's text_hash
             
         Returns:
             List of embedding values
         """
-        # Check cache first
-        cache_key = self._generate_embedding_cache_key(text)
+        if text_hash is None:
+            text_hash = text_digest(text)
+        
+        # Check the in-process cache, then Redis
+        embedding = self._embedding_lru.get(text_hash)
+        if embedding is not None:
+            return embedding
+        
+        cache_key = self._generate_embedding_cache_key(text_hash)
         cached_embedding = await redis_cache.get(cache_key)
         
         if cached_embedding:
             logger.debug(f"Using cached embedding for text: {text[:50]}...")
+            self._embedding_lru.set(text_hash, cached_embedding)
             return cached_embedding
         
+        return await self._create_uncached_embedding(text, text_hash)
+    
+    async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Create embeddings for many texts with one Redis round trip.
+        
+        Local cache hits are served first, the remaining keys are fetched
+        with a single MGET, and only the misses are embedded (concurrently).
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Embeddings in input order
+        """
+        hashes = [text_digest(text) for text in texts]
+        embeddings = [self._embedding_lru.get(text_hash) for text_hash in hashes]
+        
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if pending:
+            cached = await redis_cache.mget([self._generate_embedding_cache_key(hashes[i]) for i in pending])
+            misses = []
+            for i, cached_embedding in zip(pending, cached):
+                if cached_embedding:
+                    self._embedding_lru.set(hashes[i], cached_embedding)
+                    embeddings[i] = cached_embedding
+                else:
+                    misses.append(i)
+            
+            created = await asyncio.gather(*(
+                self._create_uncached_embedding(texts[i], hashes[i]) for i in misses
+            ))
+            for i, embedding in zip(misses, created):
+                embeddings[i] = embedding
+        
+        return embeddings
+    
+    async def _create_uncached_embedding(self, text: str, text_hash: bytes) -> List[float]:
+        """Call the embedding API and store the result in both caches."""
         try:
             # Create embedding using OpenAI
             embedding = await gemini_client.create_embedding(text, self.embedding_model)
             
             # Cache the embedding (embeddings don't change, so long TTL)
-            await redis_cache.set(cache_key, embedding, ttl=86400)  # 24 hours
+            self._embedding_lru.set(text_hash, embedding)
+            await redis_cache.set(self._generate_embedding_cache_key(text_hash), embedding, ttl=86400)  # 24 hours
             
             logger.debug(f"Created new embedding for text: {text[:50]}...")
             return embedding
@@ -182,7 +292,11 @@ class EmbeddingService:
             logger.error(f"Failed to create embedding: {str(e)}")
             raise
     
-    def calculate_cosine_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
+    def calculate_cosine_similarity(
+        self,
+        embedding1: List[float],
+        embedding2: List[float]
+    ) -> float:
         """
         Calculate cosine similarity between two embeddings.
         
@@ -214,11 +328,71 @@ class EmbeddingService:
             logger.error(f"Error calculating cosine similarity: {str(e)}")
             return 0.0
     
+    def cosine_similarities(self, query_embedding: List[float], embeddings: List[List[float]]) -> List[float]:
+        """
+        Cosine similarity of one query against many embeddings.
+        
+        Args:
+            query_embedding: Query vector
+            embeddings: Vectors to compare against, all the query's dimension
+            
+        Returns:
+            Similarity scores (0-1) in input order
+        """
+        if not embeddings:
+            return []
+        if not NUMPY_AVAILABLE:
+            return [self.calculate_cosine_similarity(query_embedding, embedding) for embedding in embeddings]
+        
+        query = np.asarray(query_embedding, dtype=np.float32)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != query.shape[0]:
+            raise ValueError(f"Embedding dimensions do not match query dimension {query.shape[0]}")
+        
+        if NUMBA_AVAILABLE:
+            scores = _cosine_batch(query, matrix)
+        else:
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            scores = np.divide(matrix @ query, norms, out=np.zeros(len(matrix), dtype=np.float32), where=norms > 0)
+        return np.clip(scores, 0.0, 1.0).tolist()
+    
+    async def _ensure_hist_matrix(self) -> "np.ndarray":
+        """
+        Embed all historical tickets once into a row-normalized float32 matrix.
+        
+        Returns:
+            Array of shape (len(historical_tickets), embedding dimension)
+        """
+        if self._hist_matrix is not None:
+            return self._hist_matrix
+        
+        async with self._hist_matrix_lock:
+            if self._hist_matrix is None:
+                embeddings = await self.create_embeddings([
+                    f"{ticket.title} {ticket.description}" for ticket in self.historical_tickets
+                ])
+                # Stored unit-norm, so each query costs one matrix-vector product
+                matrix = _normalize_rows(np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1))
+                if HNSWLIB_AVAILABLE and len(matrix) >= _ANN_MIN_TICKETS:
+                    self._ann_index = self._build_ann_index(matrix)
+                self._hist_matrix = matrix
+        return self._hist_matrix
+    
+    def _build_ann_index(self, matrix: "np.ndarray"):
+        """Build an HNSW cosine index whose labels are matrix row numbers."""
+        index = hnswlib.Index(space="cosine", dim=matrix.shape[1])
+        index.init_index(max_elements=len(matrix), ef_construction=200, M=16)
+        index.add_items(matrix, np.arange(len(matrix)))
+        index.set_ef(50)
+        logger.info(f"Built HNSW index over {len(matrix)} historical tickets")
+        return index
+    
     async def find_similar_tickets(
         self, 
         query_text: str, 
         max_results: int = 5,
-        min_similarity: float = 0.7
+        min_similarity: float = 0.7,
+        text_hash: Optional[bytes] = None
     ) -> List[SimilarityMatch]:
         """
         Find similar historical tickets using embedding similarity.
@@ -227,29 +401,31 @@ class EmbeddingService:
             query_text: Text to find similar tickets for
             max_results: Maximum number of results to return
             min_similarity: Minimum similarity threshold
+            text_hash: Precomputed text_digest(query_text)
             
         Returns:
             List of similar tickets with similarity scores
         """
         try:
             # Create embedding for query text
-            query_embedding = await self.create_embedding(query_text)
+            query_embedding = await self.create_embedding(query_text, text_hash)
+            
+            if NUMPY_AVAILABLE:
+                return await self._rank_similar_tickets(query_embedding, max_results, min_similarity)
             
             similarities = []
             
+            # Embeddings for all historical tickets (combined title and description)
+            ticket_embeddings = await self.create_embeddings([
+                f"{ticket.title} {ticket.description}" for ticket in self.historical_tickets
+            ])
+            
             # Compare with historical tickets
-            for ticket in self.historical_tickets:
-                # Create combined text for comparison
-                ticket_text = f"{ticket.title} {ticket.description}"
-                
-                # Get embedding for historical ticket
-                ticket_embedding = await self.create_embedding(ticket_text)
-                
-                # Calculate similarity
-                similarity = self.calculate_cosine_similarity(query_embedding, ticket_embedding)
-                
+            for ticket, similarity in zip(
+                self.historical_tickets, self.cosine_similarities(query_embedding, ticket_embeddings)
+            ):
                 if similarity >= min_similarity:
-                    similarities.append(SimilarityMatch(
+                    similarities.append(SimilarityMatch.build_trusted(
                         ticket_id=ticket.ticket_id,
                         similarity_score=similarity,
                         title=ticket.title,
@@ -265,6 +441,49 @@ class EmbeddingService:
             logger.error(f"Error finding similar tickets: {str(e)}")
             return []
     
+    async def _rank_similar_tickets(
+        self,
+        query_embedding: List[float],
+        max_results: int,
+        min_similarity: float
+    ) -> List[SimilarityMatch]:
+        """Score the query with one matrix-vector product, or the HNSW index for large histories."""
+        matrix = await self._ensure_hist_matrix()
+        
+        # Normalized once per query; the rows already are
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0 or not len(matrix):
+            return []
+        query = query / query_norm
+        
+        if self._ann_index is not None:
+            # Approximate top-k; hnswlib's cosine distance is 1 - similarity
+            labels, distances = self._ann_index.knn_query(query, k=min(max_results, len(matrix)))
+            similarities = np.clip(1.0 - distances[0], 0.0, 1.0)
+            keep = similarities >= min_similarity
+            ranked, ranked_scores = labels[0][keep].astype(np.intp), similarities[keep]
+        else:
+            scores = np.clip(matrix @ query, 0.0, 1.0)
+            candidates = np.flatnonzero(scores >= min_similarity)
+            # Highest similarity first; ties keep historical order
+            ranked = candidates[np.argsort(-scores[candidates], kind="stable")][:max_results]
+            ranked_scores = scores[ranked]
+        
+        return [
+            SimilarityMatch.build_trusted(
+                ticket_id=ticket.ticket_id,
+                similarity_score=score,
+                title=ticket.title,
+                category=ticket.category,
+                resolution_summary=ticket.resolution
+            )
+            for ticket, score in zip(
+                (self.historical_tickets[i] for i in ranked.tolist()),
+                ranked_scores.tolist()
+            )
+        ]
+    
     async def get_ticket_by_id(self, ticket_id: str) -> Optional[HistoricalTicket]:
         """
         Get historical ticket by ID.
@@ -80,12 +80,13 @@ class AIFeedbackService:
         actual_outcome: Dict[str, Any],
         user_rating: FeedbackRating,
         user_comments: Optional[str] = None,
-        technician_id: Optional[str] = None
+        technician_id: Optional[str] = None,
+        feedback_id: Optional[str] = None
     ) -> str:
         """Collect feedback on ticket triage accuracy."""
         
         feedback = AIFeedback(
-            feedback_id=f"triage_{ticket_id}_{int(time.time())}",
+            feedback_id=feedback_id or f"triage_{ticket_id}_{int(time.time())}",
             ticket_id=ticket_id,
             feedback_type=FeedbackType.TRIAGE_ACCURACY,
             ai_prediction=ai_prediction,
@@ -111,12 +112,13 @@ class AIFeedbackService:
         actual_outcome: Dict[str, Any],
         user_rating: FeedbackRating,
         user_comments: Optional[str] = None,
-        technician_id: Optional[str] = None
+        technician_id: Optional[str] = None,
+        feedback_id: Optional[str] = None
     ) -> str:
         """Collect feedback on SLA prediction accuracy."""
         
         feedback = AIFeedback(
-            feedback_id=f"sla_{ticket_id}_{int(time.time())}",
+            feedback_id=feedback_id or f"sla_{ticket_id}_{int(time.time())}",
             ticket_id=ticket_id,
             feedback_type=FeedbackType.SLA_PREDICTION,
             ai_prediction=ai_prediction,
@@ -142,12 +144,13 @@ class AIFeedbackService:
         resolution_outcome: Dict[str, Any],
         user_rating: FeedbackRating,
         user_comments: Optional[str] = None,
-        technician_id: Optional[str] = None
+        technician_id: Optional[str] = None,
+        feedback_id: Optional[str] = None
     ) -> str:
         """Collect feedback on resolution suggestion effectiveness."""
         
         feedback = AIFeedback(
-            feedback_id=f"resolution_{ticket_id}_{int(time.time())}",
+            feedback_id=feedback_id or f"resolution_{ticket_id}_{int(time.time())}",
             ticket_id=ticket_id,
             feedback_type=FeedbackType.RESOLUTION_EFFECTIVENESS,
             ai_prediction=ai_suggestion,
@@ -182,9 +185,17 @@ class AIFeedbackService:
         
         return metrics
     
-    async def get_improvement_recommendations(self) -> List[Dict[str, Any]]:
-        """Get recommendations for improving AI model performance."""
-        metrics = await self.get_model_performance_metrics()
+    async def get_improvement_recommendations(
+        self,
+        metrics: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get recommendations for improving AI model performance.
+        
+        Args:
+            metrics: Already fetched 30-day metrics, if the caller has them
+        """
+        if metrics is None:
+            metrics = await self.get_model_performance_metrics()
         recommendations = []
         
         # Analyze triage accuracy
@@ -2,7 +2,7 @@
 import asyncio
 import random
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 class MockTriageService:
@@ -65,7 +65,10 @@ class MockResolutionService:
 class MockEmbeddingService:
     """Mock embedding service for demo purposes."""
     
-    async def find_similar_tickets(self, query_text: str, max_results: int = 5, min_similarity: float = 0.6) -> List[Dict[str, Any]]:
+    def warm_up(self) -> None:
+        """Nothing to compile in the mock service."""
+    
+    async def find_similar_tickets(self, query_text: str, max_results: int = 5, min_similarity: float = 0.6, text_hash: Optional[bytes] = None) -> List[Dict[str, Any]]:
         """Mock similar ticket search."""
         # Simulate processing time
         await asyncio.sleep(0.1)
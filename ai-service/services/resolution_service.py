@@ -2,7 +2,7 @@
 import json
 import logging
 import time
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import hashlib
 
 from clients.gemini_client import gemini_client
@@ -118,14 +118,13 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             
             article_similarities = []
             
-            for article in self.knowledge_base:
-                # Create embedding for article
-                article_text = f"{article.title} {article.content}"
-                article_embedding = await embedding_service.create_embedding(article_text)
-                
-                # Calculate similarity
-                similarity = embedding_service.calculate_cosine_similarity(query_embedding, article_embedding)
-                
+            # Embed every article in one batch and score them together
+            article_embeddings = await embedding_service.create_embeddings([
+                f"{article.title} {article.content}" for article in self.knowledge_base
+            ])
+            similarities = embedding_service.cosine_similarities(query_embedding, article_embeddings)
+            
+            for article, similarity in zip(self.knowledge_base, similarities):
                 if similarity > 0.6:  # Minimum threshold for relevance
                     article_similarities.append((article, similarity))
             
@@ -147,8 +146,6 @@ Respond with valid JSON only, no additional text. Use this exact structure:
         
         try:
             # Use Gemini API for resolution suggestions
-            from clients.gemini_client import gemini_client
-            
             result = await gemini_client.suggest_resolution(
                 title=request.title,
                 description=request.description,
@@ -389,13 +386,13 @@ Respond with valid JSON only, no additional text. Use this exact structure:
         """Create resolution suggestion from historical ticket."""
         steps = []
         for i, step_desc in enumerate(historical_ticket.resolution_steps, 1):
-            steps.append(ResolutionStep(
+            steps.append(ResolutionStep.build_trusted(
                 step_number=i,
                 description=step_desc,
                 expected_outcome=f"Step {i} completed successfully"
             ))
         
-        return ResolutionSuggestion(
+        return ResolutionSuggestion.build_trusted(
             suggestion_id=f"hist_{historical_ticket.ticket_id}",
             title=f"Similar Issue Resolution: {historical_ticket.title}",
             description=historical_ticket.resolution,
@@ -411,7 +408,12 @@ Respond with valid JSON only, no additional text. Use this exact structure:
         )
     
     def _create_resolution_from_ai(self, ai_result: Dict, request: ResolutionSuggestionRequest) -> ResolutionSuggestion:
-        """Create resolution suggestion from AI generation."""
+        """
+        Create resolution suggestion from AI generation.
+        
+        Model output is untrusted, so these go through the validating
+        constructors; a ValidationError drops the AI suggestion.
+        """
         steps = []
         for step_data in ai_result.get("resolution_steps", []):
             steps.append(ResolutionStep(
@@ -435,7 +437,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             tags=ai_result.get("tags", [])
         )
     
-    async def get_resolution_suggestions(self, request: ResolutionSuggestionRequest) -> List[ResolutionSuggestion]:
+    async def get_resolution_suggestions(self, request: ResolutionSuggestionRequest) -> List[Dict[str, Any]]:
         """
         Get resolution suggestions for a ticket.
         
@@ -443,7 +445,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             request: Resolution suggestion request
             
         Returns:
-            List of resolution suggestions
+            List of resolution suggestions as plain dicts (ResolutionSuggestion shape)
         """
         try:
             # Check cache first
@@ -452,7 +454,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             
             if cached_suggestions:
                 logger.info(f"Returning cached resolution suggestions for ticket {request.ticket_id}")
-                return [ResolutionSuggestion(**suggestion) for suggestion in cached_suggestions]
+                return cached_suggestions
             
             suggestions = []
             
@@ -461,7 +463,8 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             similar_tickets = await embedding_service.find_similar_tickets(
                 query_text, 
                 max_results=request.max_suggestions,
-                min_similarity=0.7
+                min_similarity=0.7,
+                text_hash=request.text_hash
             )
             
             # Create suggestions from historical tickets
@@ -490,12 +493,12 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             # Limit to requested number of suggestions
             suggestions = suggestions[:request.max_suggestions]
             
-            # Cache the results
-            suggestions_dict = [suggestion.dict() for suggestion in suggestions]
+            # Serialize once; the same dicts are cached and returned
+            suggestions_dict = [suggestion.model_dump() for suggestion in suggestions]
             await redis_cache.set(cache_key, suggestions_dict, ttl=1800)  # Cache for 30 minutes
             
             logger.info(f"Generated {len(suggestions)} resolution suggestions for ticket {request.ticket_id}")
-            return suggestions
+            return suggestions_dict
             
         except Exception as e:
             logger.error(f"Failed to get resolution suggestions for ticket {request.ticket_id}: {str(e)}")
@@ -23,8 +23,15 @@ from models.sla_models import (
     HistoricalTicketData,
     SLATrainingData,
     Priority,
-    CustomerTier,
-    TicketStatus
+    PRIORITY_CODES,
+    STATUS_CODES,
+    TIER_CODES,
+    PRIORITY_SCORE,
+    TIER_SCORE,
+    PRIORITY_RISK_MULTIPLIER,
+    STATUS_RISK_MULTIPLIER,
+    PRIORITY_BASE_MINUTES,
+    BUSINESS_HOURS_MASK
 )
 from cache.redis_cache import redis_cache
 
@@ -117,14 +124,14 @@ class SLAPredictionService:
             risk_level = self._get_risk_level(breach_probability)
             
             # Calculate time predictions
-            time_remaining = int((request.sla_deadline - request.current_time).total_seconds() / 60)
+            time_remaining = int((request.sla_deadline - request.prediction_time).total_seconds() / 60)
             estimated_completion, estimated_resolution = await self._estimate_completion_time(request, features)
             
             # Identify risk factors and recommendations
             risk_factors, risk_scores = await self._analyze_risk_factors(request, features)
             recommendations = await self._generate_recommendations(request, breach_probability, risk_factors)
             
-            return SLAPredictionResult(
+            return SLAPredictionResult.build_trusted(
                 ticket_id=request.ticket_id,
                 breach_probability=breach_probability,
                 risk_level=risk_level,
@@ -136,7 +143,7 @@ class SLAPredictionService:
                 risk_factor_scores=risk_scores,
                 recommended_actions=recommendations,
                 escalation_recommended=breach_probability > 0.8,
-                reassignment_recommended=breach_probability > 0.85 and request.technician_current_workload and request.technician_current_workload > 0.9
+                reassignment_recommended=bool(breach_probability > 0.85 and request.technician_current_workload and request.technician_current_workload > 0.9)
             )
             
         except Exception as e:
@@ -147,14 +154,14 @@ class SLAPredictionService:
                 breach_probability=0.7,
                 risk_level=SLARiskLevel.HIGH,
                 confidence_score=0.3,
-                time_remaining_minutes=max(0, int((request.sla_deadline - request.current_time).total_seconds() / 60)),
+                time_remaining_minutes=max(0, int((request.sla_deadline - request.prediction_time).total_seconds() / 60)),
                 primary_risk_factors=["prediction_error"],
                 recommended_actions=["Manual review required due to prediction error"]
             )
     
     async def _extract_features(self, request: SLAPredictionRequest) -> SLAModelFeatures:
         """Extract feature vector from prediction request."""
-        current_time = request.current_time or datetime.utcnow()
+        current_time = request.prediction_time
         
         # Time-based features
         total_sla_time = (request.sla_deadline - request.created_at).total_seconds()
@@ -170,10 +177,6 @@ class SLAPredictionService:
         # Business hours calculation
         business_hours_remaining = self._calculate_business_hours_remaining(current_time, request.sla_deadline)
         
-        # Priority and tier scores
-        priority_scores = {Priority.LOW: 1, Priority.MEDIUM: 2, Priority.HIGH: 3, Priority.CRITICAL: 4}
-        tier_scores = {CustomerTier.BASIC: 1, CustomerTier.PREMIUM: 2, CustomerTier.ENTERPRISE: 3}
-        
         # Complexity features
         category_complexity = self.category_complexity.get(request.category or "other", 0.5)
         
@@ -194,8 +197,8 @@ class SLAPredictionService:
             time_remaining_ratio=time_remaining_ratio,
             progress_ratio=progress_ratio,
             business_hours_remaining=business_hours_remaining,
-            priority_score=priority_scores[request.priority],
-            tier_score=tier_scores[request.customer_tier],
+            priority_score=PRIORITY_SCORE[PRIORITY_CODES[request.priority]],
+            tier_score=TIER_SCORE[TIER_CODES[request.customer_tier]],
             description_length=len(request.description),
             title_length=len(request.title),
             category_complexity=category_complexity,
@@ -241,7 +244,7 @@ class SLAPredictionService:
     
     async def _rule_based_prediction(self, request: SLAPredictionRequest) -> Tuple[float, float]:
         """Fallback rule-based prediction when ML model is not available."""
-        current_time = request.current_time or datetime.utcnow()
+        current_time = request.prediction_time
         
         # Calculate basic time progress
         total_time = (request.sla_deadline - request.created_at).total_seconds()
@@ -252,23 +255,10 @@ class SLAPredictionService:
         base_risk = min(1.0, progress_ratio ** 1.5)
         
         # Adjust for priority
-        priority_multipliers = {
-            Priority.LOW: 0.8,
-            Priority.MEDIUM: 1.0,
-            Priority.HIGH: 1.2,
-            Priority.CRITICAL: 1.4
-        }
-        base_risk *= priority_multipliers[request.priority]
-        
-        # Adjust for status
-        status_multipliers = {
-            TicketStatus.OPEN: 1.3,  # Higher risk if not assigned
-            TicketStatus.IN_PROGRESS: 1.0,
-            TicketStatus.PENDING_CUSTOMER: 0.7,  # Lower risk if waiting for customer
-            TicketStatus.RESOLVED: 0.0,
-            TicketStatus.CLOSED: 0.0
-        }
-        base_risk *= status_multipliers[request.status]
+        base_risk *= PRIORITY_RISK_MULTIPLIER[PRIORITY_CODES[request.priority]]
+        
+        # Adjust for status (open tickets riskier, pending-customer less so, closed none)
+        base_risk *= STATUS_RISK_MULTIPLIER[STATUS_CODES[request.status]]
         
         # Adjust for escalation
         if request.escalation_level and request.escalation_level > 0:
@@ -317,7 +307,7 @@ class SLAPredictionService:
                 estimated_remaining_minutes = int(estimated_remaining_minutes * skill_factor)
             
             # Calculate estimated completion time
-            current_time = request.current_time or datetime.utcnow()
+            current_time = request.prediction_time
             estimated_completion = current_time + timedelta(minutes=estimated_remaining_minutes)
             
             return estimated_completion, estimated_remaining_minutes
@@ -402,14 +392,8 @@ class SLAPredictionService:
     
     def _get_default_resolution_time(self, priority: Priority, category: Optional[str]) -> float:
         """Get default estimated resolution time based on priority and category."""
-        base_times = {
-            Priority.CRITICAL: 60,   # 1 hour
-            Priority.HIGH: 240,      # 4 hours
-            Priority.MEDIUM: 480,    # 8 hours
-            Priority.LOW: 1440       # 24 hours
-        }
-        
-        base_time = base_times[priority]
+        # 24 hours (low) down to 1 hour (critical)
+        base_time = PRIORITY_BASE_MINUTES[PRIORITY_CODES[priority]]
         
         # Adjust for category complexity
         if category:
@@ -430,11 +414,7 @@ class SLAPredictionService:
     
     def _is_business_hours(self, timestamp: datetime) -> bool:
         """Check if timestamp is within business hours."""
-        # Simplified: Monday-Friday, 9 AM - 5 PM UTC
-        weekday = timestamp.weekday()  # 0 = Monday
-        hour = timestamp.hour
-        
-        return weekday < 5 and 9 <= hour < 17
+        return bool(BUSINESS_HOURS_MASK[timestamp.weekday(), timestamp.hour])
     
     def _features_to_vector(self, features: SLAModelFeatures) -> np.ndarray:
         """Convert features object to numpy vector."""
@@ -59,8 +59,44 @@ except ImportError:
     class LabelEncoder:
         def fit_transform(self, data): return data
 
+from services.batching import MicroBatcher
+
 logger = logging.getLogger(__name__)
 
+if TENSORFLOW_AVAILABLE:
+    try:
+        # One op at a time per inference; each op may use this worker's share of cores
+        tf.config.threading.set_intra_op_parallelism_threads(
+            int(os.getenv("TF_NUM_INTRAOP_THREADS", "0")) or os.cpu_count() or 1
+        )
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    except RuntimeError as e:
+        logger.warning(f"TensorFlow threading already initialized: {str(e)}")
+
+# Caps concurrent inference threads so TF's thread pools are not oversubscribed
+_inference_slots = asyncio.Semaphore(os.cpu_count() or 1)
+
+
+# Classification forward passes are padded up to one of these batch sizes. Sequences
+# are always padded to max_sequence_length, so the model only ever sees these shapes
+# and compiled kernels (XLA, cuDNN autotuning) are reused instead of rebuilt.
+_CLASSIFY_BATCH_BUCKETS = (8, 16, 32, 64, 128)
+
+
+def _batch_bucket(size: int) -> int:
+    """Smallest bucket holding ``size`` rows (multiples of the largest bucket beyond it)."""
+    for bucket in _CLASSIFY_BATCH_BUCKETS:
+        if size <= bucket:
+            return bucket
+    largest = _CLASSIFY_BATCH_BUCKETS[-1]
+    return -(-size // largest) * largest
+
+
+async def _run_inference(func, *args):
+    """Run blocking model inference in a worker thread, keeping the event loop free."""
+    async with _inference_slots:
+        return await asyncio.to_thread(func, *args)
+
 
 class WorkloadForecastingModel:
     """TensorFlow-based model for workload forecasting and trend prediction."""
@@ -136,17 +172,8 @@ class WorkloadForecastingModel:
             # Create sequences for prediction
             sequences = self._create_sequences(features)
             
-            # Make predictions
-            predictions = []
-            current_sequence = sequences[-1:]  # Last sequence
-            
-            for _ in range(forecast_hours):
-                pred = self.model.predict(current_sequence, verbose=0)[0][0]
-                predictions.append(float(pred))
-                
-                # Update sequence for next prediction
-                new_row = np.append(current_sequence[0][1:], [[pred] + [0] * 7], axis=0)
-                current_sequence = new_row.reshape(1, self.sequence_length, 8)
+            # Make predictions, starting from the last sequence
+            predictions = await _run_inference(self._forecast_sync, sequences[-1:], forecast_hours)
             
             # Generate forecast timestamps
             base_time = datetime.utcnow()
@@ -174,6 +201,18 @@ class WorkloadForecastingModel:
             logger.error(f"Workload prediction failed: {str(e)}")
             return await self._fallback_workload_prediction(historical_data, forecast_hours)
     
+    def _forecast_sync(self, current_sequence: np.ndarray, forecast_hours: int) -> List[float]:
+        """Autoregressive multi-step forecast; blocking, run via _run_inference."""
+        predictions = []
+        for _ in range(forecast_hours):
+            pred = self.model.predict(current_sequence, verbose=0)[0][0]
+            predictions.append(float(pred))
+            
+            # Update sequence for next prediction
+            new_row = np.append(current_sequence[0][1:], [[pred] + [0] * 7], axis=0)
+            current_sequence = new_row.reshape(1, self.sequence_length, 8)
+        return predictions
+    
     def _prepare_features(self, historical_data: List[Dict[str, Any]]) -> np.ndarray:
         """Prepare feature matrix from historical data."""
         features = []
@@ -392,6 +431,13 @@ class TicketClassificationModel:
         self.embedding_dim = 128
         self.model_path = "models/ticket_classification_model.h5"
         self.is_trained = False
+        self.categories = [
+            "hardware", "software", "network", "security", "email",
+            "database", "printer", "phone", "access", "other"
+        ]
+        self._predict_fn = None
+        # Concurrent requests share one forward pass
+        self._batcher = MicroBatcher(self.classify_ticket_batch, max_batch=32, max_wait=0.010)
         
         # Initialize model
         self._build_model()
@@ -402,6 +448,7 @@ class TicketClassificationModel:
             if os.path.exists(self.model_path):
                 self.model = keras.models.load_model(self.model_path)
                 self.is_trained = True
+                self._warm_up()
                 logger.info("Ticket classification model loaded successfully")
             else:
                 # Build new model
@@ -446,37 +493,92 @@ class TicketClassificationModel:
             if not self.is_trained or self.model is None:
                 return await self._fallback_classification(title, description)
             
-            # Prepare text input
-            text_input = f"{title} {description}"
-            
-            # Simple tokenization (in production, use proper tokenizer)
-            tokens = self._simple_tokenize(text_input)
-            
-            # Make prediction
-            prediction = self.model.predict(tokens, verbose=0)[0]
-            
-            # Get category probabilities
-            categories = [
-                "hardware", "software", "network", "security", "email",
-                "database", "printer", "phone", "access", "other"
-            ]
-            
-            category_probs = {cat: float(prob) for cat, prob in zip(categories, prediction)}
-            predicted_category = categories[np.argmax(prediction)]
-            confidence = float(np.max(prediction))
+            return await self._batcher.submit((title, description))
+        
+        except Exception as e:
+            logger.error(f"TensorFlow classification failed: {str(e)}")
+            return await self._fallback_classification(title, description)
+    
+    async def classify_tickets(
+        self,
+        titles: List[str],
+        descriptions: List[str],
+        batch_size: int = 64
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify many tickets in fixed-size forward passes.
+        
+        Args:
+            titles: Ticket titles
+            descriptions: Ticket descriptions, aligned with titles
+            batch_size: Tickets per forward pass
             
-            return {
+        Returns:
+            One classification result per ticket, in input order
+        """
+        pairs = list(zip(titles, descriptions))
+        if not self.is_trained or self.model is None:
+            return [await self._fallback_classification(title, description) for title, description in pairs]
+        
+        results = []
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start:start + batch_size]
+            try:
+                results.extend(await self.classify_ticket_batch(chunk))
+            except Exception as e:
+                logger.error(f"TensorFlow batch classification failed: {str(e)}")
+                results.extend([await self._fallback_classification(title, description) for title, description in chunk])
+        return results
+    
+    def _get_predict_fn(self):
+        """Traced forward pass, built on first use."""
+        if self._predict_fn is None:
+            # Fixed input signature: varying batch sizes reuse one traced graph
+            self._predict_fn = tf.function(
+                lambda inputs: self.model(inputs, training=False),
+                input_signature=[tf.TensorSpec([None, self.max_sequence_length], tf.int32)]
+            )
+        return self._predict_fn
+    
+    def _warm_up(self):
+        """Run one forward pass per batch bucket so first requests skip tracing and kernel setup."""
+        try:
+            predict_fn = self._get_predict_fn()
+            for bucket in _CLASSIFY_BATCH_BUCKETS:
+                predict_fn(np.zeros((bucket, self.max_sequence_length), dtype=np.int32))
+        except Exception as e:
+            logger.warning(f"Ticket classification warm-up failed: {str(e)}")
+    
+    async def classify_ticket_batch(self, tickets: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Classify several (title, description) pairs with a single forward pass."""
+        # Simple tokenization (in production, use proper tokenizer); rows past
+        # len(tickets) are zero padding up to the batch bucket
+        batch = np.zeros((_batch_bucket(len(tickets)), self.max_sequence_length), dtype=np.int32)
+        for row, (title, description) in enumerate(tickets):
+            batch[row] = self._simple_tokenize(f"{title} {description}")[0]
+        predictions = (await _run_inference(self._predict_batch_sync, batch))[:len(tickets)]
+        
+        # Row-wise argmax/max once for the whole batch, then index the category table
+        categories = self.categories
+        return [
+            {
                 "success": True,
-                "predicted_category": predicted_category,
+                "predicted_category": categories[index],
                 "confidence_score": confidence,
-                "category_probabilities": category_probs,
+                "category_probabilities": dict(zip(categories, probabilities)),
                 "model_type": "tensorflow_cnn",
                 "features_used": ["title", "description"]
             }
-            
-        except Exception as e:
-            logger.error(f"TensorFlow classification failed: {str(e)}")
-            return await self._fallback_classification(title, description)
+            for index, confidence, probabilities in zip(
+                predictions.argmax(axis=1).tolist(),
+                predictions.max(axis=1).tolist(),
+                predictions.tolist()
+            )
+        ]
+    
+    def _predict_batch_sync(self, batch: np.ndarray) -> np.ndarray:
+        """Forward pass over a token matrix; blocking, run via _run_inference."""
+        return self._get_predict_fn()(batch).numpy()
     
     def _simple_tokenize(self, text: str) -> np.ndarray:
         """Simple tokenization for text input."""
@@ -16,11 +16,18 @@ from models.ticket_models import (
     Urgency,
     Impact,
     CategoryConfidence,
-    PriorityMatrix
+    PriorityMatrix,
+    VALIDATORS,
+    CATEGORY_BY_VALUE,
+    PRIORITY_BY_VALUE,
+    URGENCY_BY_VALUE,
+    IMPACT_BY_VALUE
 )
 
 logger = logging.getLogger(__name__)
 
+_TRIAGE_RESULT_ADAPTER = VALIDATORS["TriageResult"]
+
 
 class TicketTriageService:
     """Service for AI-powered ticket triage and classification."""
@@ -137,8 +144,6 @@ Respond with valid JSON only, no additional text. Use this exact structure:
         """Use Gemini AI to classify the ticket with enhanced accuracy."""
         try:
             # First try Gemini API for classification
-            from clients.gemini_client import gemini_client
-            
             result = await gemini_client.classify_ticket(
                 title=request.title,
                 description=request.description,
@@ -201,7 +206,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
     def _calculate_keyword_confidence(self, request: TicketTriageRequest, predicted_category: str) -> float:
         """Calculate confidence boost based on keyword matching."""
         text = f"{request.title} {request.description}".lower()
-        category_keywords = self.category_keywords.get(TicketCategory(predicted_category), [])
+        category_keywords = self.category_keywords.get(CATEGORY_BY_VALUE[predicted_category], [])
         
         matches = sum(1 for keyword in category_keywords if keyword.lower() in text)
         if category_keywords:
@@ -310,8 +315,8 @@ Respond with valid JSON only, no additional text. Use this exact structure:
                 ai_result["impact"] = "medium"
         
         # Recalculate priority based on adjusted urgency/impact
-        urgency = Urgency(ai_result["urgency"])
-        impact = Impact(ai_result["impact"])
+        urgency = URGENCY_BY_VALUE[ai_result["urgency"]]
+        impact = IMPACT_BY_VALUE[ai_result["impact"]]
         priority = self._calculate_priority(urgency, impact)
         ai_result["priority"] = priority.value
         
@@ -339,7 +344,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             
             if cached_result:
                 logger.info(f"Returning cached triage result for ticket {request.ticket_id}")
-                return TriageResult(**cached_result)
+                return _TRIAGE_RESULT_ADAPTER.validate_python(cached_result)
             
             # Perform AI classification
             ai_result = await self._classify_with_ai(request)
@@ -347,13 +352,13 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             # Enhance with rule-based logic
             enhanced_result = self._enhance_with_rules(ai_result, request)
             
-            # Build final result
+            # Build final result (validating: confidence, skills and time come from the model)
             triage_result = TriageResult(
                 ticket_id=request.ticket_id,
-                category=TicketCategory(enhanced_result["category"]),
-                priority=Priority(enhanced_result["priority"]),
-                urgency=Urgency(enhanced_result["urgency"]),
-                impact=Impact(enhanced_result["impact"]),
+                category=CATEGORY_BY_VALUE[enhanced_result["category"]],
+                priority=PRIORITY_BY_VALUE[enhanced_result["priority"]],
+                urgency=URGENCY_BY_VALUE[enhanced_result["urgency"]],
+                impact=IMPACT_BY_VALUE[enhanced_result["impact"]],
                 confidence_score=enhanced_result.get("confidence_score", 0.8),
                 reasoning=enhanced_result.get("reasoning", "AI classification"),
                 suggested_technician_skills=enhanced_result.get("suggested_technician_skills", []),
@@ -361,7 +366,7 @@ Respond with valid JSON only, no additional text. Use this exact structure:
             )
             
             # Cache the result
-            await redis_cache.set(cache_key, triage_result.dict(), ttl=3600)  # Cache for 1 hour
+            await redis_cache.set(cache_key, triage_result.model_dump(), ttl=3600)  # Cache for 1 hour
             
             processing_time = (time.time() - start_time) * 1000
             logger.info(f"Ticket {request.ticket_id} triaged in {processing_time:.2f}ms")
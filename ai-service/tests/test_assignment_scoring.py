@@ -0,0 +1,226 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+import main
+from main import (
+    _score_assignments_loop,
+    _score_assignments_matching,
+    _score_assignments_vectorized,
+)
+from services import assignment_matching
+from services.advanced_analytics import AdvancedAnalyticsService
+from services.assignment_matching import match_with_slots
+
+SKILLS = ["networking", "windows", "linux", "email", "security", "hardware", "database", "vpn"]
+
+
+def make_technicians(rng, count, workload=lambda rng: rng.randint(0, 35)):
+    return [
+        {
+            "technician_id": f"tech-{i}",
+            "id": f"tech-{i}",
+            "skills": rng.sample(SKILLS, rng.randint(0, 4)),
+            "current_workload": workload(rng),
+            "max_capacity": 40,
+            "experience_level": rng.randint(1, 10),
+        }
+        for i in range(count)
+    ]
+
+
+def make_tickets(rng, count):
+    return [
+        {
+            "ticket_id": f"ticket-{i}",
+            "id": f"ticket-{i}",
+            "required_skills": rng.sample(SKILLS + ["mainframe"], rng.randint(0, 3)),
+            "priority": rng.choice(["critical", "high", "medium", "low"]),
+        }
+        for i in range(count)
+    ]
+
+
+def best_capacity_total(score, capacity):
+    """Brute-force best total score with at most capacity[n] tickets per technician."""
+    n_tickets, n_technicians = score.shape
+    best = -np.inf
+    for choice in itertools.product(range(n_technicians), repeat=n_tickets):
+        if all(choice.count(n) <= capacity[n] for n in range(n_technicians)):
+            best = max(best, sum(score[t, n] for t, n in enumerate(choice)))
+    return best
+
+
+class TestBasicAssignmentScoring:
+    """main.py scoring paths must agree with the scalar loop."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_vectorized_matches_loop(self, seed):
+        rng = random.Random(seed)
+        technicians = make_technicians(rng, rng.randint(1, 30))
+        tickets = make_tickets(rng, rng.randint(1, 30))
+
+        assert _score_assignments_vectorized(technicians, tickets) == _score_assignments_loop(technicians, tickets)
+
+    @pytest.mark.skipif(not main.NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("seed", range(20))
+    def test_compiled_matches_loop(self, seed):
+        rng = random.Random(seed)
+        technicians = make_technicians(rng, rng.randint(1, 30))
+        tickets = make_tickets(rng, rng.randint(1, 30))
+
+        assert main._score_assignments_compiled(technicians, tickets) == _score_assignments_loop(technicians, tickets)
+
+    def test_identical_technicians_tie_to_lowest_index(self):
+        technicians = [
+            {"technician_id": f"tech-{i}", "skills": ["vpn"], "current_workload": 10, "experience_level": 5}
+            for i in range(10)
+        ]
+        tickets = [{"ticket_id": "t", "required_skills": ["vpn"]}, {"ticket_id": "u", "required_skills": []}]
+
+        expected = _score_assignments_loop(technicians, tickets)
+        assert [selection[0] for selection in expected] == [0, 0]
+        assert _score_assignments_vectorized(technicians, tickets) == expected
+        if main.NUMBA_AVAILABLE:
+            assert main._score_assignments_compiled(technicians, tickets) == expected
+
+    @pytest.mark.skipif(not main.SCIPY_AVAILABLE, reason="scipy not installed")
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matching_respects_free_capacity(self, seed):
+        rng = random.Random(seed)
+        technicians = make_technicians(rng, 3, workload=lambda rng: 40 - rng.randint(1, 3))
+        tickets = make_tickets(rng, 5)
+        capacity = [tech["max_capacity"] - tech["current_workload"] for tech in technicians]
+        score, _ = main._score_matrix(technicians, tickets)
+
+        selections = _score_assignments_matching(technicians, tickets)
+        chosen = [selection[0] for selection in selections]
+
+        if sum(capacity) >= len(tickets):
+            assert all(chosen.count(n) <= capacity[n] for n in range(len(technicians)))
+        for row, (index, value, skill_match) in enumerate(selections):
+            assert value == score[row, index]
+
+    @pytest.mark.skipif(not main.SCIPY_AVAILABLE, reason="scipy not installed")
+    def test_matching_spreads_tickets_off_the_top_scorer(self):
+        technicians = [
+            {"technician_id": "star", "skills": ["vpn"], "current_workload": 38, "max_capacity": 40, "experience_level": 10},
+            {"technician_id": "spare", "skills": [], "current_workload": 0, "max_capacity": 40, "experience_level": 1},
+        ]
+        tickets = [{"ticket_id": f"t{i}", "required_skills": ["vpn"]} for i in range(4)]
+
+        greedy = [selection[0] for selection in _score_assignments_loop(technicians, tickets)]
+        matched = [selection[0] for selection in _score_assignments_matching(technicians, tickets)]
+
+        assert greedy == [0, 0, 0, 0]
+        assert sorted(matched) == [0, 0, 1, 1]
+
+    @pytest.mark.skipif(not main.SCIPY_AVAILABLE, reason="scipy not installed")
+    def test_matching_falls_back_to_greedy_when_slots_run_out(self):
+        technicians = [
+            {"technician_id": "a", "skills": ["vpn"], "current_workload": 39, "max_capacity": 40, "experience_level": 5},
+            {"technician_id": "b", "skills": [], "current_workload": 40, "max_capacity": 40, "experience_level": 5},
+        ]
+        tickets = [{"ticket_id": f"t{i}", "required_skills": ["vpn"]} for i in range(3)]
+
+        selections = _score_assignments_matching(technicians, tickets)
+        greedy = _score_assignments_loop(technicians, tickets)
+
+        # One free slot: one ticket is matched, the rest keep their greedy pick
+        assert [selection[0] for selection in selections] == [0, 0, 0]
+        assert selections == greedy
+
+
+class TestAdvancedAssignmentMatching:
+    """AdvancedAnalyticsService score matrix and Hungarian matching."""
+
+    @pytest.fixture
+    def service(self):
+        return AdvancedAnalyticsService()
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_score_matrix_matches_scalar_scorer(self, service, seed):
+        rng = random.Random(seed)
+        technicians = make_technicians(rng, rng.randint(1, 12), workload=lambda rng: rng.random())
+        tickets = make_tickets(rng, rng.randint(1, 12))
+
+        score = service._assignment_score_matrix(technicians, tickets)
+
+        assert score.shape == (len(tickets), len(technicians))
+        for row, ticket in enumerate(tickets):
+            for column, technician in enumerate(technicians):
+                expected = service._calculate_assignment_score(technician, ticket)
+                assert score[row, column] == pytest.approx(expected, abs=1e-12)
+
+    @pytest.mark.skipif(not assignment_matching.SCIPY_AVAILABLE, reason="scipy not installed")
+    @pytest.mark.parametrize("n_tickets,n_technicians", [(4, 2), (5, 2), (3, 3), (6, 4), (2, 5)])
+    def test_matching_spreads_tickets_over_equal_slots(self, service, n_tickets, n_technicians):
+        rng = np.random.default_rng(n_tickets * 10 + n_technicians)
+        score = rng.random((n_tickets, n_technicians))
+        slots = -(-n_tickets // n_technicians)
+
+        choices = service._match_assignments(score)
+        chosen = [index for index, _ in choices]
+
+        assert all(chosen.count(n) <= slots for n in range(n_technicians))
+        assert [value for _, value in choices] == [score[t, n] for t, n in enumerate(chosen)]
+
+    @pytest.mark.skipif(not assignment_matching.SCIPY_AVAILABLE, reason="scipy not installed")
+    def test_matching_spreads_tickets_evenly(self, service):
+        # Technician 0 is the best choice for every ticket
+        score = np.array([[0.9, 0.5], [0.8, 0.4], [0.95, 0.3], [0.7, 0.6]])
+
+        chosen = [index for index, _ in service._match_assignments(score)]
+
+        assert sorted(chosen) == [0, 0, 1, 1]
+
+    def test_argmax_fallback_without_scipy(self, service, monkeypatch):
+        monkeypatch.setattr(assignment_matching, "SCIPY_AVAILABLE", False)
+        score = np.array([[0.9, 0.5], [0.8, 0.4], [0.95, 0.3], [0.2, 0.6]])
+
+        assert service._match_assignments(score) == [(0, 0.9), (0, 0.8), (0, 0.95), (1, 0.6)]
+
+    def test_argmax_fallback_for_oversized_inputs(self, service, monkeypatch):
+        monkeypatch.setattr(assignment_matching, "MAX_MATCHING_CELLS", 0)
+        score = np.array([[0.9, 0.5], [0.8, 0.4]])
+
+        assert service._match_assignments(score) == [(0, 0.9), (0, 0.8)]
+
+
+@pytest.mark.skipif(not assignment_matching.SCIPY_AVAILABLE, reason="scipy not installed")
+class TestMatchWithSlots:
+    """Replicated-slot Hungarian matching shared by both optimizers."""
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_matches_brute_force_optimum(self, seed):
+        rng = np.random.default_rng(seed)
+        n_tickets, n_technicians = int(rng.integers(1, 6)), int(rng.integers(1, 4))
+        score = rng.random((n_tickets, n_technicians))
+        slots = rng.integers(0, 4, size=n_technicians)
+        if slots.sum() < n_tickets:
+            slots[0] += n_tickets - slots.sum()
+
+        best = match_with_slots(score, slots)
+
+        assert (best >= 0).all()
+        assert all((best == n).sum() <= slots[n] for n in range(n_technicians))
+        total = score[np.arange(n_tickets), best].sum()
+        assert total == pytest.approx(best_capacity_total(score, slots.tolist()))
+
+    def test_leftover_tickets_are_marked_unmatched(self):
+        score = np.array([[0.9, 0.1], [0.8, 0.2], [0.7, 0.3]])
+
+        best = match_with_slots(score, np.array([1, 0]))
+
+        assert sorted(best.tolist()) == [-1, -1, 0]
+        assert best[0] == 0
+
+    def test_no_slots_returns_none(self):
+        assert match_with_slots(np.ones((2, 2)), np.array([0, 0])) is None
+
+    def test_oversized_matrix_returns_none(self, monkeypatch):
+        monkeypatch.setattr(assignment_matching, "MAX_MATCHING_CELLS", 3)
+
+        assert match_with_slots(np.ones((2, 2)), np.array([1, 1])) is None
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from services.batching import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Every submitted item must resolve; none may hang or be dropped."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_returned_per_item(self):
+        async def double(items):
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(double, max_batch=8, max_wait=0.01)
+
+        assert await asyncio.gather(*(batcher.submit(i) for i in range(5))) == [0, 2, 4, 6, 8]
+
+    @pytest.mark.asyncio
+    async def test_short_result_list_fails_every_caller(self):
+        async def drop_last(items):
+            return items[:-1]
+
+        batcher = MicroBatcher(drop_last, max_batch=8, max_wait=0.01)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+            timeout=1.0
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_restarted_worker_keeps_queued_items(self):
+        gate = asyncio.Event()
+        calls = []
+
+        async def handler(items):
+            calls.append(list(items))
+            if items == ["stuck"]:
+                await gate.wait()
+            return [item.upper() for item in items]
+
+        batcher = MicroBatcher(handler, max_batch=1, max_wait=0.0)
+        stuck = asyncio.ensure_future(batcher.submit("stuck"))
+        queued = [asyncio.ensure_future(batcher.submit(item)) for item in ("a", "b")]
+        while not calls:
+            await asyncio.sleep(0)
+
+        # The worker dies mid-batch with "a" and "b" still queued
+        batcher._worker.cancel()
+        await asyncio.sleep(0)
+
+        results = await asyncio.wait_for(asyncio.gather(*queued, batcher.submit("c")), timeout=1.0)
+
+        assert results == ["A", "B", "C"]
+        stuck.cancel()
@@ -0,0 +1,54 @@
+import pytest
+
+from main import (
+    AHOCORASICK_AVAILABLE,
+    _classify,
+    _scan_keywords_automaton,
+    _scan_keywords_tokens,
+)
+
+
+# (lowercased ticket text, expected (category, priority))
+SCANNER_CASES = [
+    ("forgot my password", ("access", "medium")),
+    ("passwords expired again", ("access", "medium")),
+    ("two screens flickering", ("hardware", "medium")),
+    ("hacks reported on the vpn", ("security", "medium")),
+    ("email, urgent!", ("email", "high")),
+    ("the network is down.", ("network", "high")),
+    ("outlook/e-mail sync (critical)", ("email", "high")),
+    ("wifi's dropping", ("network", "medium")),
+    ("login to wifi", ("access", "medium")),
+    ("urgent but minor", ("other", "high")),
+    ("fix when possible", ("other", "low")),
+    ("low-priority printer request", ("other", "low")),
+    # Keywords embedded in longer words do not match
+    ("emailing the team", ("other", "medium")),
+    ("installation guide", ("other", "medium")),
+    ("hacker news article", ("other", "medium")),
+    ("downloaded a lowercase file", ("other", "medium")),
+    ("wifi5 router", ("other", "medium")),
+    ("", ("other", "medium")),
+]
+
+
+class TestKeywordScanners:
+    """The automaton and token scanners must classify identically."""
+
+    @pytest.mark.parametrize("text,expected", SCANNER_CASES)
+    def test_token_scanner(self, text, expected):
+        assert _scan_keywords_tokens(text) == expected
+
+    @pytest.mark.skipif(not AHOCORASICK_AVAILABLE, reason="pyahocorasick not installed")
+    @pytest.mark.parametrize("text,expected", SCANNER_CASES)
+    def test_automaton_matches_token_scanner(self, text, expected):
+        assert _scan_keywords_automaton(text) == _scan_keywords_tokens(text) == expected
+
+    @pytest.mark.parametrize("title,description,expected", [
+        ("PASSWORD Reset", "", ("access", "medium")),
+        ("Outlook", "Mail Server DOWN", ("email", "high")),
+        ("Printer", "Fix When Possible", ("other", "low")),
+        ("Laptops", "Screens are BLANK", ("hardware", "medium")),
+    ])
+    def test_classify_ignores_case(self, title, description, expected):
+        assert _classify(title, description) == expected
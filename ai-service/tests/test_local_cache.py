@@ -0,0 +1,34 @@
+from cache.local_cache import LocalTTLCache
+
+
+class TestLocalTTLCache:
+    """Values handed out by the cache must not alias the stored entry."""
+
+    def test_mutating_a_result_does_not_change_the_entry(self):
+        cache = LocalTTLCache(maxsize=10, ttl=60)
+        cache.set("k", {"suggestions": [{"steps": [1, 2]}]})
+
+        first = cache.get("k")
+        first["suggestions"][0]["steps"].append(3)
+        first["cached"] = True
+
+        assert cache.get("k") == {"suggestions": [{"steps": [1, 2]}]}
+
+    def test_custom_copier_is_applied_on_get(self):
+        cache = LocalTTLCache(maxsize=10, ttl=60, copier=list)
+        cache.set("k", [0.1, 0.2])
+
+        cache.get("k").append(0.3)
+
+        assert cache.get("k") == [0.1, 0.2]
+
+    def test_expired_and_evicted_entries_are_dropped(self):
+        cache = LocalTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=0)
+        cache.set("c", 3)
+
+        # "a" was least recently used when "c" pushed the cache past maxsize
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from middleware.rate_limiter import RateLimiter
+
+
+class FakeCounterCache:
+    """In-memory stand-in for the Redis counter used by RateLimiter."""
+
+    def __init__(self):
+        self.counts = {}
+        self.calls = []
+
+    async def increment(self, key, amount=1, ttl=None):
+        self.calls.append((key, amount))
+        self.counts[key] = self.counts.get(key, 0) + amount
+        return self.counts[key]
+
+
+class TestRateLimiter:
+    """Local admission must never let a client past the fixed Redis window."""
+
+    WINDOW = 60
+    WINDOW_START = 1_700_000_040  # multiple of WINDOW
+
+    @pytest.fixture
+    def cache(self):
+        return FakeCounterCache()
+
+    def limiter(self, cache, limit, sync_every=100):
+        return RateLimiter(
+            requests_per_window=limit,
+            window_seconds=self.WINDOW,
+            sync_every=sync_every,
+            max_local_keys=100,
+            cache=cache
+        )
+
+    @pytest.mark.asyncio
+    async def test_denies_at_limit_and_stays_denied_until_window_resets(self, cache):
+        limiter = self.limiter(cache, limit=5)
+
+        results = [
+            (await limiter.is_allowed("ip:1", now=self.WINDOW_START + i))[0]
+            for i in range(5)
+        ]
+        assert results == [True] * 5
+
+        # Every later request in the same window is denied, however long we wait within it
+        for offset in (5, 10, 30, self.WINDOW - 1):
+            allowed, info = await limiter.is_allowed("ip:1", now=self.WINDOW_START + offset)
+            assert allowed is False
+            assert info["requests_remaining"] == 0
+
+        allowed, _ = await limiter.is_allowed("ip:1", now=self.WINDOW_START + self.WINDOW)
+        assert allowed is True
+
+    @pytest.mark.asyncio
+    async def test_elapsed_time_does_not_refill_quota_within_window(self, cache, monkeypatch):
+        limiter = self.limiter(cache, limit=100)
+        clock = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+        for i in range(100):
+            assert (await limiter.is_allowed("ip:5", now=self.WINDOW_START))[0]
+        assert not (await limiter.is_allowed("ip:5", now=self.WINDOW_START))[0]
+
+        # Long enough for a rate-based refill of many tokens, still inside the window
+        clock[0] += 30
+        for offset in range(30, self.WINDOW):
+            allowed, _ = await limiter.is_allowed("ip:5", now=self.WINDOW_START + offset)
+            assert allowed is False
+
+    @pytest.mark.asyncio
+    async def test_local_admission_never_exceeds_limit(self, cache):
+        limiter = self.limiter(cache, limit=10)
+
+        allowed = 0
+        for i in range(50):
+            is_allowed, _ = await limiter.is_allowed("ip:2", now=self.WINDOW_START + i % self.WINDOW)
+            allowed += is_allowed
+
+        assert allowed == 10
+        # Some requests were answered locally rather than each hitting Redis
+        assert len(cache.calls) < 50
+
+    @pytest.mark.asyncio
+    async def test_unsynced_hits_are_not_flushed_into_next_window(self, cache):
+        limiter = self.limiter(cache, limit=100)
+
+        for i in range(4):
+            assert (await limiter.is_allowed("ip:3", now=self.WINDOW_START + i))[0]
+        # First request synced with Redis, the next three were admitted locally
+        assert cache.calls == [(f"rate_limit:ip:3:{self.WINDOW_START}", 1)]
+
+        next_window = self.WINDOW_START + self.WINDOW
+        assert (await limiter.is_allowed("ip:3", now=next_window))[0]
+        assert cache.calls[-1] == (f"rate_limit:ip:3:{next_window}", 1)
+
+    @pytest.mark.asyncio
+    async def test_denied_client_is_not_readmitted_locally(self, cache):
+        limiter = self.limiter(cache, limit=3, sync_every=100)
+
+        for i in range(3):
+            await limiter.is_allowed("ip:4", now=self.WINDOW_START)
+        calls_before = len(cache.calls)
+
+        for _ in range(5):
+            allowed, _ = await limiter.is_allowed("ip:4", now=self.WINDOW_START + 1)
+            assert allowed is False
+        # Each denied request is checked against Redis, none admitted from a local bucket
+        assert len(cache.calls) == calls_before + 5
@@ -0,0 +1,23 @@
+import pytest
+
+from main import _parse_top_k
+
+
+class TestParseTopK:
+    """top_k on /ai/predict-sla-risks-advanced must be a non-negative int."""
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, None),
+        (0, 0),
+        (5, 5),
+        (5.0, 5),
+        ("12", 12),
+        (" 3 ", 3),
+    ])
+    def test_accepts_whole_numbers(self, value, expected):
+        assert _parse_top_k(value) == expected
+
+    @pytest.mark.parametrize("value", [True, False, -1, 2.5, -3.0, "abc", "-2", "", [3], {"k": 3}])
+    def test_rejects_invalid_values(self, value):
+        with pytest.raises(ValueError):
+            _parse_top_k(value)